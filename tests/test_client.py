@@ -0,0 +1,201 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from ticktick_mcp.client import TickTickClient
+
+
+def _response(payload: bytes, data):
+    response = MagicMock()
+    response.status_code = 200
+    response.content = payload
+    response.json.return_value = data
+    return response
+
+
+@pytest.mark.asyncio
+async def test_project_reads_are_cached_until_write():
+    """get_projects reuses the cached list until a write clears it."""
+    projects = _response(b'[{"id": "p1"}]', [{"id": "p1"}])
+    created = _response(b'{"id": "t1"}', {"id": "t1"})
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(side_effect=[projects, created, projects])
+
+        client = TickTickClient(access_token="token")
+        assert await client.get_projects() == [{"id": "p1"}]
+        assert await client.get_projects() == [{"id": "p1"}]
+        assert instance.request.await_count == 1
+
+        await client.create_task({"title": "New"})
+        await client.get_projects()
+        assert instance.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_zero_cache_ttl_disables_caching():
+    """cache_ttl=0 sends every project read to the API."""
+    projects = _response(b'[{"id": "p1"}]', [{"id": "p1"}])
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(return_value=projects)
+
+        client = TickTickClient(access_token="token", cache_ttl=0)
+        await client.get_projects()
+        await client.get_projects()
+        assert instance.request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_project_read_refreshes_in_background():
+    """An expired entry inside the stale window is served while it refetches."""
+    import asyncio
+    import time
+
+    old = _response(b'[{"id": "p1"}]', [{"id": "p1"}])
+    new = _response(b'[{"id": "p2"}]', [{"id": "p2"}])
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(side_effect=[old, new])
+
+        client = TickTickClient(access_token="token", cache_ttl=30, cache_stale=30)
+        await client.get_projects()
+        expires, value = client._cache["/project"]
+        client._cache["/project"] = (time.monotonic() - 1, value)
+
+        assert await client.get_projects() == [{"id": "p1"}]
+        await asyncio.sleep(0)
+        assert instance.request.await_count == 2
+        assert await client.get_projects() == [{"id": "p2"}]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_backs_off_and_retries():
+    """A 429 halves the concurrency limit and the request is retried."""
+    limited = _response(b"", None)
+    limited.status_code = 429
+    limited.headers = {"Retry-After": "0"}
+    task = _response(b'{"id": "t1"}', {"id": "t1"})
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(side_effect=[limited, task])
+
+        client = TickTickClient(access_token="token")
+        start = client._limiter.limit
+        assert await client.get_task("p1", "t1") == {"id": "t1"}
+        assert instance.request.await_count == 2
+        assert client._limiter.limit == start // 2
+
+
+@pytest.mark.asyncio
+async def test_persistent_rate_limit_raises():
+    from ticktick_mcp.client import RATE_LIMIT_RETRIES, RateLimitError
+
+    limited = _response(b"", None)
+    limited.status_code = 429
+    limited.text = "slow down"
+    limited.headers = {"Retry-After": "0"}
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(return_value=limited)
+
+        client = TickTickClient(access_token="token")
+        with pytest.raises(RateLimitError):
+            await client.get_task("p1", "t1")
+        assert instance.request.await_count == RATE_LIMIT_RETRIES + 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_return_their_limiter_slots():
+    """Cancelling in-flight and queued requests leaves the limiter's capacity intact."""
+    import asyncio
+
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(side_effect=hang)
+
+        client = TickTickClient(access_token="token")
+        limit = client._limiter.limit
+        tasks = [asyncio.ensure_future(client.get_task("p1", f"t{i}")) for i in range(limit + 3)]
+        await asyncio.sleep(0.01)
+        assert client._limiter._in_flight == limit  # the rest are queued
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert client._limiter._in_flight == 0
+        assert client._limiter._waiters == []
+        assert client._limiter.limit == limit
+
+
+@pytest.mark.asyncio
+async def test_read_overlapping_a_write_is_not_cached():
+    """A GET still in flight when a write lands doesn't fill the cache."""
+    import asyncio
+
+    release_first = asyncio.Event()
+    old = _response(b'[{"id": "p1"}]', [{"id": "p1"}])
+    created = _response(b'{"id": "p2"}', {"id": "p2"})
+    new = _response(b'[{"id": "p1"}, {"id": "p2"}]', [{"id": "p1"}, {"id": "p2"}])
+    responses = iter([created, new])
+
+    async def send(method, path, **kwargs):
+        if method == "GET" and not release_first.is_set():
+            await release_first.wait()
+            return old
+        return next(responses)
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(side_effect=send)
+
+        client = TickTickClient(access_token="token")
+        slow = asyncio.ensure_future(client.get_projects())
+        await asyncio.sleep(0.01)
+        await client.create_project({"name": "New"})  # write while the GET is in flight
+        release_first.set()
+        assert await slow == [{"id": "p1"}]
+
+        # The pre-write result was not cached, so this refetches
+        assert await client.get_projects() == [{"id": "p1"}, {"id": "p2"}]
+        assert instance.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_cancelled_refreshes():
+    """close() cancels background refreshes and lets them finish before returning."""
+    import asyncio
+    import time
+
+    old = _response(b'[{"id": "p1"}]', [{"id": "p1"}])
+    calls = 0
+
+    async def send(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            await asyncio.sleep(10)
+        return old
+
+    with patch("ticktick_mcp.client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(side_effect=send)
+        instance.aclose = AsyncMock()
+
+        client = TickTickClient(access_token="token", cache_ttl=30, cache_stale=30)
+        await client.get_projects()
+        expires, value = client._cache["/project"]
+        client._cache["/project"] = (time.monotonic() - 1, value)
+        await client.get_projects()
+        refresh = client._refreshing["/project"]
+        await asyncio.sleep(0)
+
+        await client.close()
+        assert refresh.done()
+        assert client._refreshing == {}
+        instance.aclose.assert_awaited_once()
@@ -0,0 +1,62 @@
+import json
+
+
+def test_format_json_matches_stdlib_output():
+    from ticktick_mcp.formatting import format_json
+    data = {"count": 1, "tasks": [{"title": "Café 🔴", "tags": [], "content": None}]}
+    assert format_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_format_json_non_string_keys():
+    from ticktick_mcp.formatting import format_json
+    assert json.loads(format_json({1: "a"})) == {"1": "a"}
+
+
+def test_format_task_md_optional_fields():
+    from ticktick_mcp.formatting import format_task_md
+    task = {
+        "id": "t1",
+        "projectId": "p1",
+        "title": "Write report",
+        "priority": 5,
+        "content": "x" * 250,
+        "dueDate": "2026-03-01T09:00:00+0000",
+        "tags": ["work", "urgent"],
+        "items": [{"title": "Outline", "status": 1}],
+    }
+    assert format_task_md(task).splitlines() == [
+        "## 🔴 Write report",
+        "- **ID**: `t1`",
+        "- **Project**: `p1`",
+        "- **Priority**: High",
+        "- **Status**: Active",
+        f"- **Content**: {'x' * 200}",
+        "- **Due**: 2026-03-01T09:00:00+0000",
+        "- **Tags**: work, urgent",
+        "- **Subtasks** (1):",
+        "  - [x] Outline",
+    ]
+
+
+def test_format_tasks_md_stops_at_budget():
+    from ticktick_mcp.formatting import format_tasks_md
+    tasks = [{"id": f"t{i}", "title": f"Task {i}", "content": "x" * 150} for i in range(50)]
+    full = format_tasks_md(tasks, "Inbox")
+    assert format_tasks_md(tasks, "Inbox", max_chars=len(full) + 200) == full
+
+    limited = format_tasks_md(tasks, "Inbox", max_chars=2_000)
+    assert len(limited) <= 2_000
+    assert "`t0`" in limited
+    assert "`t49`" not in limited
+    assert "more tasks not shown" in limited
+
+
+def test_format_project_with_tasks_md_matches_separate_formatters():
+    from ticktick_mcp.formatting import (
+        format_project_with_tasks_md, format_projects_md, format_tasks_md,
+    )
+    project = {"id": "p1", "name": "Work", "color": "#ff0000"}
+    tasks = [{"id": "t1", "title": "Draft", "priority": 5}]
+    expected = format_projects_md([project]) + "\n\n" + format_tasks_md(tasks, "Work")
+    assert format_project_with_tasks_md(project, tasks) == expected
+    assert format_project_with_tasks_md(project, []).endswith("No tasks found.")
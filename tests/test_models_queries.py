@@ -27,10 +27,48 @@ def test_search_all_tasks_input_requires_query():
 def test_get_engaged_tasks_input():
     from ticktick_mcp.models import GetEngagedTasksInput
     params = GetEngagedTasksInput()
-    assert params.response_format.value == "markdown"
+    assert params.response_format == "markdown"
 
 
 def test_plan_day_input():
     from ticktick_mcp.models import PlanDayInput
     params = PlanDayInput(available_hours=6.0)
     assert params.available_hours == 6.0
+
+
+def test_inputs_are_frozen():
+    from ticktick_mcp.models import PlanDayInput
+    params = PlanDayInput(available_hours=6.0)
+    with pytest.raises(ValidationError):
+        params.available_hours = 8.0
+
+
+def test_task_inputs_share_iso_date_check():
+    from ticktick_mcp.models import CreateTaskInput, UpdateTaskInput
+    for kwargs in (
+        {"title": "Call", "project_id": "p1"},
+        {"task_id": "t1", "project_id": "p1"},
+    ):
+        model = CreateTaskInput if "title" in kwargs else UpdateTaskInput
+        with pytest.raises(ValidationError, match="ISO format"):
+            model(**kwargs, due_date="2026-03-15")
+        with pytest.raises(ValidationError, match="ISO format"):
+            model(**kwargs, start_date="tomorrow")
+        with pytest.raises(ValidationError, match="ISO format"):
+            model(**kwargs, due_date="hello T world")
+        assert model(**kwargs, due_date="2026-03-15T09:00:00+0000").due_date == "2026-03-15T09:00:00+0000"
+
+
+def test_focus_date_range_accepts_yyyymmdd():
+    from ticktick_mcp.models import GetFocusHeatmapInput
+    params = GetFocusHeatmapInput(date_from="20260201", date_to=20260213)
+    assert (params.date_from, params.date_to) == (20260201, 20260213)
+    with pytest.raises(ValidationError):
+        GetFocusHeatmapInput(date_from="2026-02-01", date_to=20260213)
+
+
+def test_focus_date_range_rejects_impossible_dates():
+    from ticktick_mcp.models import GetFocusHeatmapInput
+    for bad in (20261399, 20260230, 20260100):
+        with pytest.raises(ValidationError, match="real calendar date"):
+            GetFocusHeatmapInput(date_from=bad, date_to=20260213)
@@ -53,3 +53,193 @@ def test_sort_by_priority_then_date():
     assert [t["title"] for t in sorted_tasks] == [
         "High early", "High late", "Medium", "Low"
     ]
+
+
+def test_parse_date_formats():
+    from ticktick_mcp.queries import parse_date
+    expected = datetime(2026, 2, 13, 9, 0, tzinfo=timezone.utc)
+    assert parse_date("2026-02-13T09:00:00+0000") == expected
+    assert parse_date("2026-02-13T09:00:00.000+0000") == expected
+    assert parse_date("2026-02-13T04:00:00-0500") == expected
+    assert parse_date("2026-02-13T09:00:00Z") == expected
+    assert parse_date("2026-02-13T09:00:00.250+0000") == expected.replace(microsecond=250_000)
+    assert parse_date("") is None
+    assert parse_date(None) is None
+    assert parse_date("not a date") is None
+
+
+def test_categorize_tasks_matches_filters():
+    from ticktick_mcp.queries import categorize_tasks
+    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    tasks = [
+        _make_task("Last week", due_date="2026-02-06T09:00:00+0000"),
+        _make_task("This morning", due_date="2026-02-13T09:00:00+0000"),
+        _make_task("Tonight", due_date="2026-02-13T20:00:00+0000"),
+        _make_task("Friday", due_date="2026-02-18T09:00:00+0000"),
+        _make_task("Next month", due_date="2026-03-13T09:00:00+0000"),
+        _make_task("Someday"),
+        _make_task("Done", due_date="2026-02-06T09:00:00+0000", status=2),
+    ]
+    buckets = categorize_tasks(tasks, now)
+    titles = {k: [t["title"] for t in v] for k, v in buckets.items()}
+    assert titles["overdue"] == ["Last week", "This morning"]
+    assert titles["today"] == ["This morning", "Tonight"]
+    assert titles["this_week"] == ["Friday"]
+    assert titles["no_date"] == ["Someday"]
+
+
+def test_filter_engaged_limit_matches_full_sort():
+    from ticktick_mcp.queries import filter_engaged
+    tasks = [
+        _make_task("Overdue low", due_date="2026-01-05T09:00:00+0000", priority=1),
+        _make_task("High future", due_date="2099-01-01T09:00:00+0000", priority=5),
+        _make_task("High overdue", due_date="2026-01-01T09:00:00+0000", priority=5),
+        _make_task("Medium future", due_date="2099-01-01T09:00:00+0000", priority=3),
+        _make_task("High done", priority=5, status=2),
+    ]
+    full = filter_engaged(tasks)
+    assert [t["title"] for t in full] == ["High overdue", "High future", "Overdue low"]
+    assert filter_engaged(tasks, limit=2) == full[:2]
+
+
+def test_filters_use_supplied_now():
+    from ticktick_mcp.queries import filter_due_this_week, filter_engaged, filter_overdue_tasks
+    now = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+    tasks = [
+        _make_task("Yesterday", due_date="2026-03-09T09:00:00+0000"),
+        _make_task("Friday", due_date="2026-03-13T09:00:00+0000"),
+    ]
+    assert [t["title"] for t in filter_overdue_tasks(tasks, now)] == ["Yesterday"]
+    assert [t["title"] for t in filter_engaged(tasks, now=now)] == ["Yesterday"]
+    assert [t["title"] for t in filter_due_this_week(tasks, now)] == ["Friday"]
+
+
+def test_parse_date_is_cached():
+    from ticktick_mcp.queries import parse_date
+    parse_date.cache_clear()
+    first = parse_date("2026-02-13T09:00:00+0000")
+    assert parse_date("2026-02-13T09:00:00+0000") is first
+    assert parse_date.cache_info().hits == 1
+
+
+def test_sort_compares_instants_across_offsets():
+    from ticktick_mcp.queries import sort_by_priority_then_date
+    tasks = [
+        _make_task("New York 9am", due_date="2026-02-01T09:00:00-0500"),
+        _make_task("UTC noon", due_date="2026-02-01T12:00:00+0000"),
+        _make_task("No date"),
+    ]
+    assert [t["title"] for t in sort_by_priority_then_date(tasks)] == [
+        "UTC noon", "New York 9am", "No date"
+    ]
+
+
+def test_search_tasks_combined_filters():
+    from ticktick_mcp.queries import search_tasks
+    tasks = [
+        _make_task("Record voiceover", priority=5),
+        _make_task("Edit voiceover", priority=3),
+        _make_task("Voiceover done", priority=5, status=2),
+        _make_task("Buy milk", priority=5),
+    ]
+    titles = lambda ts: [t["title"] for t in ts]
+    assert titles(search_tasks(tasks, "VOICEOVER")) == [
+        "Record voiceover", "Edit voiceover", "Voiceover done"
+    ]
+    assert titles(search_tasks(tasks, "voiceover", priority=5, include_completed=False)) == [
+        "Record voiceover"
+    ]
+    assert titles(search_tasks(tasks, None, include_completed=False)) == [
+        "Record voiceover", "Edit voiceover", "Buy milk"
+    ]
+
+
+def test_day_filters_compare_calendar_days():
+    from ticktick_mcp.queries import filter_due_this_week, filter_due_today
+    now = datetime(2026, 3, 10, 23, 30, tzinfo=timezone.utc)
+    tasks = [
+        _make_task("Today early", due_date="2026-03-10T00:00:00+0000"),
+        _make_task("Tomorrow", due_date="2026-03-11T00:00:00+0000"),
+        _make_task("Day seven", due_date="2026-03-17T23:59:00+0000"),
+        _make_task("Day eight", due_date="2026-03-18T00:00:00+0000"),
+    ]
+    assert [t["title"] for t in filter_due_today(tasks, now)] == ["Today early"]
+    assert [t["title"] for t in filter_due_this_week(tasks, now)] == ["Tomorrow", "Day seven"]
+
+
+def test_search_tasks_matches_all_words_in_any_order():
+    from ticktick_mcp.queries import search_tasks
+    tasks = [
+        _make_task("Record voiceover for intro"),
+        _make_task("Intro music"),
+        _make_task("Voiceover outro"),
+    ]
+    tasks[2]["content"] = "Reuse the intro take"
+    titles = [t["title"] for t in search_tasks(tasks, "intro  VOICEOVER")]
+    assert titles == ["Record voiceover for intro", "Voiceover outro"]
+
+
+def test_filter_day_candidates_matches_combined_filters():
+    from ticktick_mcp.queries import filter_day_candidates
+    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    tasks = [
+        _make_task("Overdue", due_date="2026-02-10T09:00:00+0000", priority=1),
+        _make_task("Tonight", due_date="2026-02-13T20:00:00+0000", priority=3),
+        _make_task("High someday", priority=5),
+        _make_task("High overdue", due_date="2026-02-12T09:00:00+0000", priority=5),
+        _make_task("Next week", due_date="2026-02-20T09:00:00+0000"),
+        _make_task("Done high", priority=5, status=2),
+    ]
+    assert [t["title"] for t in filter_day_candidates(tasks, now)] == [
+        "High overdue", "High someday", "Tonight", "Overdue"
+    ]
+
+
+def test_categorize_tasks_collects_completed_in_same_pass():
+    from ticktick_mcp.queries import categorize_tasks, filter_completed_since
+    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    since = datetime(2026, 2, 12, 0, 0, tzinfo=timezone.utc)
+    tasks = [
+        _make_task("Done yesterday", status=2),
+        _make_task("Done last week", status=2),
+        _make_task("Open", due_date="2026-02-13T09:00:00+0000"),
+    ]
+    tasks[0]["completedTime"] = "2026-02-12T15:00:00.000+0000"
+    tasks[1]["completedTime"] = "2026-02-05T15:00:00.000+0000"
+    buckets = categorize_tasks(tasks, now, completed_since=since)
+    assert buckets["completed"] == filter_completed_since(tasks, since) == [tasks[0]]
+    assert "completed" not in categorize_tasks(tasks, now)
+
+
+def test_sort_with_limit_matches_slicing_full_sort():
+    from ticktick_mcp.queries import sort_by_priority_then_date
+
+    tasks = [
+        {"id": str(i), "priority": p, "dueDate": d}
+        for i, (p, d) in enumerate([
+            (0, "2026-02-13T09:00:00+0000"), (5, None), (3, "2026-02-10T09:00:00+0000"),
+            (5, "2026-02-11T09:00:00+0000"), (None, "2026-02-09T09:00:00+0000"),
+            (3, "2026-02-10T09:00:00+0000"), (5, "2026-02-11T09:00:00+0000"),
+        ])
+    ]
+    for limit in (0, 1, 3, 10):
+        assert sort_by_priority_then_date(tasks, limit=limit) == \
+            sort_by_priority_then_date(tasks)[:limit]
+
+
+def test_current_streak_counts_consecutive_days_back_from_latest():
+    from ticktick_mcp.queries import current_streak
+
+    # Runs across a month boundary, ignoring duplicates and bad stamps
+    assert current_streak([20260301, 20260228, 20260227, 20260227, 20260225, None]) == 3
+    assert current_streak(["20260105"]) == 1
+    assert current_streak([]) == 0
+
+
+def test_parse_date_cache_clear_also_clears_sort_keys():
+    from ticktick_mcp.queries import _due_epoch, parse_date, sort_by_priority_then_date
+    sort_by_priority_then_date([{"dueDate": "2026-02-13T09:00:00+0000"}, {"dueDate": None}])
+    assert _due_epoch.cache_info().currsize > 0
+    parse_date.cache_clear()
+    assert _due_epoch.cache_info().currsize == 0
+    assert parse_date.cache_info().currsize == 0
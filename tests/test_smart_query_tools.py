@@ -5,7 +5,7 @@ correctly fetch, filter, and format task data.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 def _make_mock_ctx(projects, project_data_map):
@@ -112,3 +112,252 @@ async def test_ticktick_get_overdue_empty():
     result = await ticktick_get_overdue_tasks.fn(GetOverdueTasksInput(), ctx)
     # Should handle empty result gracefully (no crash)
     assert isinstance(result, str)
+
+
+@pytest.mark.asyncio
+async def test_ticktick_batch_move_tasks_reports_failures():
+    from ticktick_mcp.client import TickTickAPIError
+    from ticktick_mcp.server import ticktick_batch_move_tasks
+    from ticktick_mcp.models import BatchMoveTasksInput
+
+    ctx = _make_mock_ctx([], {})
+    client = ctx.request_context.lifespan_context["ticktick"]
+
+    async def update_task(tid, body):
+        if tid == "missing":
+            raise TickTickAPIError(404, "not found")
+        return body
+
+    client.update_task = AsyncMock(side_effect=update_task)
+
+    params = BatchMoveTasksInput(to_project_id="p2", task_ids=["t1", "missing", "t3"])
+    result = await ticktick_batch_move_tasks.fn(params, ctx)
+    assert "Moved 2 of 3 tasks" in result
+    assert "`missing`" in result
+    bodies = [call.args[1] for call in client.update_task.await_args_list]
+    assert {b["id"] for b in bodies} == {"t1", "missing", "t3"}
+    assert all(b == {"id": b["id"], "projectId": "p2"} for b in bodies)
+
+
+@pytest.mark.asyncio
+async def test_ticktick_move_task_same_project_is_noop():
+    from ticktick_mcp.server import ticktick_move_task
+    from ticktick_mcp.models import MoveTaskInput
+
+    ctx = _make_mock_ctx([], {})
+    client = ctx.request_context.lifespan_context["ticktick"]
+    client.update_task = AsyncMock()
+
+    params = MoveTaskInput(task_id="t1", from_project_id="p1", to_project_id="p1")
+    result = await ticktick_move_task.fn(params, ctx)
+    assert "already in project `p1`" in result
+    client.update_task.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ticktick_search_all_tasks_caps_results():
+    import json
+    from ticktick_mcp import server
+    from ticktick_mcp.models import SearchAllTasksInput
+
+    tasks = [
+        {"id": f"t{i}", "title": f"Report {i}", "status": 0, "projectId": "p1"}
+        for i in range(8)
+    ]
+    ctx = _make_mock_ctx([{"id": "p1", "name": "Work"}], {"p1": {"tasks": tasks}})
+    with patch.object(server, "MAX_SEARCH_RESULTS", 5):
+        payload = json.loads(await server.ticktick_search_all_tasks.fn(
+            SearchAllTasksInput(query="report", response_format="json"), ctx
+        ))
+        result = await server.ticktick_search_all_tasks.fn(SearchAllTasksInput(query="report"), ctx)
+    assert payload["count"] == 5
+    assert payload["omitted"] == 3
+    assert "3 additional tasks omitted" in result
+
+
+def test_task_body_builders_share_field_table():
+    from ticktick_mcp.models import CreateTaskInput, UpdateTaskInput
+    from ticktick_mcp.server import _apply_task_fields, _build_task_body
+
+    create = CreateTaskInput(
+        title="Draft", project_id="p1", content="", is_all_day=False,
+        tags=["video"], subtasks=[{"title": "Outline"}, {"title": "Cut", "sort_order": 2}],
+    )
+    assert _build_task_body(create) == {
+        "projectId": "p1", "title": "Draft", "isAllDay": False, "tags": ["video"],
+        "items": [{"title": "Outline", "status": 0}, {"title": "Cut", "status": 0, "sortOrder": 2}],
+    }
+    # Updates keep explicit empty values so fields can be cleared
+    update = UpdateTaskInput(task_id="t1", project_id="p1", content="", tags=[], priority=0)
+    assert _apply_task_fields({}, update, skip_empty=False) == {
+        "content": "", "priority": 0, "tags": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_project_data_is_concurrent_and_bounded():
+    import asyncio
+    from ticktick_mcp.server import _fetch_project_data
+
+    in_flight = peak = 0
+
+    async def get_project_with_data(pid):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"id": pid}
+
+    client = MagicMock()
+    client.get_project_with_data = get_project_with_data
+    ids = [f"p{i}" for i in range(10)]
+    results = await _fetch_project_data(client, ids, concurrency=3)
+    assert [r["id"] for r in results] == ids
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_tasks_prefers_v2_sync():
+    from ticktick_mcp.server import _fetch_all_tasks
+
+    ctx = _make_mock_ctx([{"id": "p1", "name": "Work"}], {})
+    v2 = MagicMock()
+    v2.get_all_tasks = AsyncMock(return_value=(
+        [{"id": "p1", "name": "Work"}, {"id": "p2", "name": "Old", "closed": True}],
+        [
+            {"id": "t1", "projectId": "p1"},
+            {"id": "t2", "projectId": "p2"},
+            {"id": "t3", "projectId": "inbox123"},
+        ],
+    ))
+    ctx.request_context.lifespan_context["ticktick_v2"] = v2
+
+    tasks, name_map = await _fetch_all_tasks(ctx)
+    assert tasks == [{"id": "t1", "projectId": "p1"}]
+    assert name_map == {"p1": "Work"}
+    ctx.request_context.lifespan_context["ticktick"].get_project_with_data.assert_not_awaited()
+
+    # Falls back to the V1 fan-out if the sync call fails
+    v2.get_all_tasks.side_effect = RuntimeError("boom")
+    tasks, name_map = await _fetch_all_tasks(ctx)
+    assert name_map == {"p1": "Work"}
+    ctx.request_context.lifespan_context["ticktick"].get_project_with_data.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_ticktick_get_project_stops_rendering_at_budget():
+    from ticktick_mcp.server import ticktick_get_project
+    from ticktick_mcp.models import GetProjectInput
+
+    tasks = [
+        {"id": f"t{i}", "title": f"Task {i}", "content": "x" * 180, "projectId": "p1"}
+        for i in range(150)
+    ]
+    data = {"project": {"id": "p1", "name": "Work"}, "tasks": tasks}
+    ctx = _make_mock_ctx([], {"p1": data})
+    result = await ticktick_get_project.fn(GetProjectInput(project_id="p1"), ctx)
+    assert "more tasks not shown" in result
+    assert "Response truncated" not in result
+
+
+@pytest.mark.asyncio
+async def test_fetch_project_data_skips_failed_projects():
+    from ticktick_mcp.client import TickTickAPIError
+    from ticktick_mcp.server import _fetch_project_data
+
+    async def get_project_with_data(pid):
+        if pid == "bad":
+            raise TickTickAPIError(500, "boom")
+        return {"tasks": [{"id": pid}]}
+
+    client = MagicMock()
+    client.get_project_with_data = get_project_with_data
+    results = await _fetch_project_data(client, ["p1", "bad", "p2"])
+    assert results == [{"tasks": [{"id": "p1"}]}, {}, {"tasks": [{"id": "p2"}]}]
+
+    with pytest.raises(TickTickAPIError):
+        await _fetch_project_data(client, ["bad"])
+
+
+@pytest.mark.asyncio
+async def test_ticktick_search_all_tasks_stops_at_max_results():
+    import asyncio
+    import json
+    from ticktick_mcp.server import ticktick_search_all_tasks
+    from ticktick_mcp.models import SearchAllTasksInput
+
+    projects = [{"id": "fast", "name": "Fast"}, {"id": "slow", "name": "Slow"}]
+    ctx = _make_mock_ctx(projects, {})
+    fetched = []
+
+    async def get_project_with_data(pid):
+        if pid == "slow":
+            await asyncio.sleep(1)
+        fetched.append(pid)
+        return {"tasks": [{"id": f"{pid}-1", "title": "Report", "status": 0}]}
+
+    ctx.request_context.lifespan_context["ticktick"].get_project_with_data = get_project_with_data
+    params = SearchAllTasksInput(query="report", max_results=1, response_format="json")
+    payload = json.loads(await ticktick_search_all_tasks.fn(params, ctx))
+    assert [t["id"] for t in payload["tasks"]] == ["fast-1"]
+    assert payload["stopped_early"] is True
+    assert fetched == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_json_task_lists_carry_project_names():
+    import json
+    from ticktick_mcp.server import ticktick_get_engaged_tasks
+    from ticktick_mcp.models import GetEngagedTasksInput
+
+    tasks = [{"id": "t1", "title": "Ship", "priority": 5, "status": 0, "projectId": "p1"}]
+    ctx = _make_mock_ctx([{"id": "p1", "name": "Work"}], {"p1": {"tasks": tasks}})
+    payload = json.loads(await ticktick_get_engaged_tasks.fn(
+        GetEngagedTasksInput(response_format="json"), ctx
+    ))
+    assert payload["tasks"][0]["_project_name"] == "Work"
+
+
+def test_budgeted_lines_stop_formatting_at_limit():
+    from ticktick_mcp.server import _BudgetedLines
+
+    formatted = []
+
+    def rows():
+        for i in range(100):
+            formatted.append(i)
+            yield f"row {i:02d}"
+
+    out = _BudgetedLines(max_chars=50)
+    out.append("# Header")
+    out.extend(rows())
+    assert out.full
+    assert out.lines[-1] == _BudgetedLines.MARKER
+    assert len(out.text()) <= 50
+    assert len(formatted) < 10
+
+    empty = _BudgetedLines()
+    empty.extend(iter(()), empty="  None.")
+    assert empty.text() == "  None."
+
+
+@pytest.mark.asyncio
+async def test_json_project_names_do_not_leak_into_cached_tasks():
+    import json
+    from ticktick_mcp.server import ticktick_get_project, ticktick_search_all_tasks
+    from ticktick_mcp.models import GetProjectInput, SearchAllTasksInput
+
+    tasks = [{"id": "t1", "title": "Report", "status": 0, "projectId": "p1"}]
+    data = {"project": {"id": "p1", "name": "Work"}, "tasks": tasks}
+    ctx = _make_mock_ctx([{"id": "p1", "name": "Work"}], {"p1": data})
+
+    for max_results in (None, 1):  # full fetch and streaming search
+        await ticktick_search_all_tasks.fn(
+            SearchAllTasksInput(query="report", max_results=max_results, response_format="json"), ctx
+        )
+    assert tasks == [{"id": "t1", "title": "Report", "status": 0, "projectId": "p1"}]
+    payload = json.loads(await ticktick_get_project.fn(
+        GetProjectInput(project_id="p1", response_format="json"), ctx
+    ))
+    assert "_project_name" not in json.dumps(payload)
@@ -29,6 +29,10 @@ async def test_v2_client_signon_sets_token():
         assert client._token == "fake-session-token"
         assert client.is_authenticated
 
+        import json
+        x_device = json.loads(instance.post.await_args.kwargs["headers"]["X-Device"])
+        assert x_device["id"] == client._device_id
+
 
 @pytest.mark.asyncio
 async def test_v2_client_signon_failure_raises():
@@ -45,3 +49,177 @@ async def test_v2_client_signon_failure_raises():
         client = TickTickV2Client(username="user@test.com", password="wrong")
         with pytest.raises(V2AuthError, match="Authentication failed"):
             await client.authenticate()
+
+
+@pytest.mark.asyncio
+async def test_v2_client_concurrent_requests_sign_on_once():
+    """Requests fanned out before the first signon share one signon."""
+    import asyncio
+
+    signon = MagicMock()
+    signon.status_code = 200
+    signon.content = b'{"token": "fake-session-token"}'
+    signon.json.return_value = {"token": "fake-session-token"}
+    ok = MagicMock()
+    ok.status_code = 200
+    ok.content = b"[]"
+    ok.text = "[]"
+    ok.json.return_value = []
+
+    async def post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return signon
+
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.post = AsyncMock(side_effect=post)
+        instance.request = AsyncMock(return_value=ok)
+
+        client = TickTickV2Client(username="user@test.com", password="pass123")
+        await asyncio.gather(
+            client.get_habits(),
+            client.get_focus_heatmap("20260101", "20260107"),
+            client.get_focus_distribution("20260101", "20260107"),
+        )
+        assert instance.post.await_count == 1
+        assert instance.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_v2_client_error_detail_is_capped():
+    """Large error pages are cut to the first ERROR_DETAIL_BYTES in the exception."""
+    from ticktick_mcp.v2_client import ERROR_DETAIL_BYTES, TickTickV2APIError
+
+    error = MagicMock()
+    error.status_code = 500
+    error.content = b"x" * 50_000
+
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(return_value=error)
+
+        client = TickTickV2Client(username="user@test.com", password="pass123")
+        client._token = "fake-session-token"
+        with pytest.raises(TickTickV2APIError, match=rf": x{{{ERROR_DETAIL_BYTES}}}$"):
+            await client.get_habits()
+
+
+@pytest.mark.asyncio
+async def test_v2_client_caches_stats_reads_until_write():
+    """Repeat focus reads are served from the cache until a V2 write."""
+    ok = MagicMock()
+    ok.status_code = 200
+    ok.content = b"[]"
+    ok.json.return_value = []
+
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.request = AsyncMock(return_value=ok)
+
+        client = TickTickV2Client(username="user@test.com", password="pass123")
+        client._token = "fake-session-token"
+        await client.get_focus_heatmap("20260101", "20260107")
+        await client.get_focus_heatmap("20260101", "20260107")
+        assert instance.request.await_count == 1
+
+        await client.checkin_habit([{"habitId": "h1"}])
+        await client.get_focus_heatmap("20260101", "20260107")
+        assert instance.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_v2_client_context_manager_closes_http_client():
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.aclose = AsyncMock()
+
+        async with TickTickV2Client(username="user@test.com", password="pass123") as client:
+            assert isinstance(client, TickTickV2Client)
+        instance.aclose.assert_awaited_once()
+
+
+def _mock_transport_client(handler):
+    """Patch target building real httpx clients that send to `handler`."""
+    import httpx
+    real = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    return lambda **kwargs: real(transport=transport, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_v2_requests_carry_current_session_token():
+    """After signon, requests send the token as the "t" cookie and a Bearer header."""
+    import httpx
+    seen = []
+
+    def handler(request):
+        if request.url.path.endswith("/user/signon"):
+            return httpx.Response(200, json={"token": "session-1"})
+        seen.append(request)
+        return httpx.Response(200, json=[])
+
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient", _mock_transport_client(handler)):
+        client = TickTickV2Client(username="user@test.com", password="pass123")
+        await client.get_habits()
+        await client.close()
+
+    assert seen[0].headers["Cookie"] == "t=session-1"
+    assert seen[0].headers["Authorization"] == "Bearer session-1"
+
+
+@pytest.mark.asyncio
+async def test_v2_cookie_only_requests_omit_bearer_header():
+    """With cookie_only, requests after signon carry the "t" cookie and no Authorization."""
+    import httpx
+    seen = []
+
+    def handler(request):
+        if request.url.path.endswith("/user/signon"):
+            return httpx.Response(200, json={"token": "session-1"})
+        seen.append(request)
+        return httpx.Response(200, json=[])
+
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient", _mock_transport_client(handler)):
+        client = TickTickV2Client(username="user@test.com", password="pass123", cookie_only=True)
+        await client.get_habits()
+        await client.close()
+
+    assert seen[0].headers["Cookie"] == "t=session-1"
+    assert "Authorization" not in seen[0].headers
+
+
+@pytest.mark.asyncio
+async def test_v2_cached_reads_are_copies_and_skip_results_older_than_a_write():
+    """Cache hits can't be mutated by callers; a GET overlapping a write isn't cached."""
+    import asyncio
+    import httpx
+
+    heatmaps = iter([[{"duration": 1}], [{"duration": 2}], [{"duration": 3}]])
+    release_first = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path.endswith("/user/signon"):
+            return httpx.Response(200, json={"token": "session-1"})
+        if request.method == "POST":
+            return httpx.Response(200, json={})
+        body = next(heatmaps)
+        if body == [{"duration": 1}]:
+            await release_first.wait()
+        return httpx.Response(200, json=body)
+
+    with patch("ticktick_mcp.v2_client.httpx.AsyncClient", _mock_transport_client(handler)):
+        client = TickTickV2Client(username="user@test.com", password="pass123")
+        await client.authenticate()
+
+        slow = asyncio.ensure_future(client.get_focus_heatmap("20260101", "20260107"))
+        await asyncio.sleep(0.01)
+        await client.checkin_habit([{"habitId": "h1"}])  # write while the GET is in flight
+        release_first.set()
+        assert await slow == [{"duration": 1}]
+
+        # The pre-write result was not cached, so this refetches
+        fresh = await client.get_focus_heatmap("20260101", "20260107")
+        assert fresh == [{"duration": 2}]
+        fresh[0]["duration"] = 99
+        assert await client.get_focus_heatmap("20260101", "20260107") == [{"duration": 2}]
+        await client.close()
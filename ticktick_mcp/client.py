@@ -7,16 +7,40 @@ is created at server start and reused for all requests.
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+from importlib.util import find_spec
 
 import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 load_dotenv()
 
 API_BASE_URL = "https://api.ticktick.com/open/v1"
 OAUTH_TOKEN_URL = "https://ticktick.com/oauth/token"
 REQUEST_TIMEOUT = 30.0
+# Seconds to reuse project reads between tool calls; 0 disables the cache.
+CACHE_TTL = float(os.getenv("TICKTICK_CACHE_TTL", "30"))
+# Seconds past expiry a cached read may still be served while it refreshes
+# in the background (stale-while-revalidate); 0 always refetches inline.
+CACHE_STALE = float(os.getenv("TICKTICK_CACHE_STALE", "30"))
+
+# HTTP/2 lets concurrent project fetches multiplex over one TLS connection.
+# It needs the optional `h2` package; without it httpx stays on HTTP/1.1.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Adaptive (AIMD) bound on in-flight requests: halved on every 429, grown
+# by one after a full window of successes. Starts at the server's fan-out.
+CONCURRENCY_INITIAL = 8
+CONCURRENCY_MAX = 20
+RATE_LIMIT_RETRIES = 2
 
 
 class TickTickAPIError(Exception):
@@ -28,6 +52,67 @@ class TickTickAPIError(Exception):
         super().__init__(f"TickTick API error {status_code}: {detail}")
 
 
+class RateLimitError(TickTickAPIError):
+    """Raised when the API still answers 429 after backing off and retrying."""
+
+
+class _AdaptiveLimiter:
+    """AIMD concurrency limit shared by every request from one client.
+
+    Like TCP congestion control: the limit is halved when the API answers
+    429 and grows by one after `limit` consecutive successes, so bursts
+    from concurrent tool fan-outs settle just under the rate limit.
+
+    release() is synchronous so a slot is always returned, even when the
+    request holding it is cancelled (e.g. an early-stopping search).
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = CONCURRENCY_MAX) -> None:
+        self.limit = initial
+        self._min = minimum
+        self._max = maximum
+        self._in_flight = 0
+        self._successes = 0
+        self._waiters: list[asyncio.Future] = []
+
+    async def acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                # Still queued only if cancelled before a release woke it
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    def release(self, overloaded: bool | None) -> None:
+        """Free a slot. None (no response: cancelled or failed) leaves the limit alone."""
+        self._in_flight -= 1
+        if overloaded:
+            self.limit = max(self._min, self.limit // 2)
+            self._successes = 0
+        elif overloaded is not None:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self._max:
+                self.limit += 1
+                self._successes = 0
+        # Wake every waiter; each re-checks the limit before taking a slot
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 429: Retry-After if given, else backoff."""
+    try:
+        return min(float(response.headers.get("Retry-After", "")), 10.0)
+    except (TypeError, ValueError):
+        return 0.5 * 2 ** attempt
+
+
 class TickTickClient:
     """Async wrapper around the TickTick Open API v1.
 
@@ -35,9 +120,19 @@ class TickTickClient:
         client = TickTickClient()   # reads token from env
         data = await client.get_projects()
         await client.close()
+
+    Project reads are cached for CACHE_TTL seconds (TICKTICK_CACHE_TTL) so
+    back-to-back tool calls don't refetch every project. For CACHE_STALE
+    more seconds an expired entry is still returned while a background
+    refresh runs. Any write clears the cache.
     """
 
-    def __init__(self, access_token: str | None = None) -> None:
+    def __init__(
+        self,
+        access_token: str | None = None,
+        cache_ttl: float | None = None,
+        cache_stale: float | None = None,
+    ) -> None:
         self._access_token = access_token or os.getenv("TICKTICK_ACCESS_TOKEN", "")
         if not self._access_token:
             raise ValueError(
@@ -52,10 +147,22 @@ class TickTickClient:
                 "Content-Type": "application/json",
             },
             timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            limits=CONNECTION_LIMITS,
         )
+        self._cache_ttl = CACHE_TTL if cache_ttl is None else cache_ttl
+        self._cache_stale = CACHE_STALE if cache_stale is None else cache_stale
+        self._cache: dict[str, tuple[float, dict | list | None]] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._cache_generation = 0
+        self._limiter = _AdaptiveLimiter(CONCURRENCY_INITIAL)
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         await self._http.aclose()
 
     # ------------------------------------------------------------------
@@ -70,27 +177,88 @@ class TickTickClient:
         json_body: dict | list | None = None,
         params: dict | None = None,
     ) -> dict | list | None:
-        """Make an API request and handle errors consistently."""
-        response = await self._http.request(
-            method,
-            path,
-            json=json_body,
-            params=params,
-        )
+        """Make an API request and handle errors consistently.
+
+        Requests pass through the adaptive limiter; a 429 shrinks it and is
+        retried up to RATE_LIMIT_RETRIES times before RateLimitError.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await self._limiter.acquire()
+            overloaded = None
+            try:
+                response = await self._http.request(
+                    method,
+                    path,
+                    json=json_body,
+                    params=params,
+                )
+                overloaded = response.status_code == 429
+            finally:
+                self._limiter.release(overloaded)
+            if not overloaded or attempt == RATE_LIMIT_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        if method != "GET":
+            self.invalidate_cache()
         if response.status_code >= 400:
             detail = response.text or f"HTTP {response.status_code}"
-            raise TickTickAPIError(response.status_code, detail)
-        if response.status_code == 204 or not response.text:
+            error = RateLimitError if response.status_code == 429 else TickTickAPIError
+            raise error(response.status_code, detail)
+        if response.status_code == 204 or not response.content:
             return None
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
+    async def _cached_get(self, path: str) -> dict | list | None:
+        """GET through the short-lived read cache."""
+        if self._cache_ttl <= 0:
+            return await self._request("GET", path)
+        now = time.monotonic()
+        hit = self._cache.get(path)
+        if hit is not None:
+            expires, value = hit
+            if expires > now:
+                return value
+            if expires + self._cache_stale > now:
+                if path not in self._refreshing:
+                    self._refreshing[path] = asyncio.create_task(
+                        self._refresh(path, self._cache_generation)
+                    )
+                return value
+        generation = self._cache_generation
+        result = await self._request("GET", path)
+        # A write while this GET was in flight means the result may predate it
+        if generation == self._cache_generation:
+            self._cache[path] = (now + self._cache_ttl, result)
+        return result
+
+    async def _refresh(self, path: str, generation: int) -> None:
+        """Background refetch of a stale cache entry."""
+        try:
+            result = await self._request("GET", path)
+        except Exception:
+            # Keep serving the stale copy; once it ages out, the next read
+            # refetches inline and surfaces the error to the caller.
+            return
+        finally:
+            self._refreshing.pop(path, None)
+        # A write since the refresh started means the result may predate it
+        if generation == self._cache_generation:
+            self._cache[path] = (time.monotonic() + self._cache_ttl, result)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached reads (called automatically after every write)."""
+        self._cache.clear()
+        self._cache_generation += 1
+
     # ------------------------------------------------------------------
     # Projects
     # ------------------------------------------------------------------
 
     async def get_projects(self) -> list[dict]:
         """GET /project — list all projects/lists."""
-        result = await self._request("GET", "/project")
+        result = await self._cached_get("/project")
         return result if isinstance(result, list) else []
 
     async def get_project(self, project_id: str) -> dict:
@@ -100,7 +268,7 @@ class TickTickClient:
 
     async def get_project_with_data(self, project_id: str) -> dict:
         """GET /project/{id}/data — get project with all tasks and columns."""
-        result = await self._request("GET", f"/project/{project_id}/data")
+        result = await self._cached_get(f"/project/{project_id}/data")
         return result if isinstance(result, dict) else {}
 
     async def create_project(self, body: dict) -> dict:
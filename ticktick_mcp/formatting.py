@@ -9,47 +9,49 @@ from __future__ import annotations
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 CHARACTER_LIMIT = 25_000
+_OMITTED_NOTE_RESERVE = 100  # room kept for the "N more tasks" note
 
 # ---------------------------------------------------------------------------
 # Priority display
 # ---------------------------------------------------------------------------
 
-PRIORITY_LABELS = {
-    0: "None",
-    1: "Low",
-    3: "Medium",
-    5: "High",
-}
-
-PRIORITY_ICONS = {
-    0: "",
-    1: "🔵",
-    3: "🟡",
-    5: "🔴",
-}
+# Indexed directly by TickTick's priority value (0, 1, 3, 5); None marks gaps.
+PRIORITY_LABELS = ("None", "Low", None, "Medium", None, "High")
+PRIORITY_ICONS = ("", "🔵", None, "🟡", None, "🔴")
 
 
 def priority_label(value: int) -> str:
     """Convert priority int to human label."""
-    return PRIORITY_LABELS.get(value, f"Unknown({value})")
+    if type(value) is int and 0 <= value <= 5 and PRIORITY_LABELS[value] is not None:
+        return PRIORITY_LABELS[value]
+    return f"Unknown({value})"
 
 
 def priority_icon(value: int) -> str:
     """Convert priority int to emoji icon."""
-    return PRIORITY_ICONS.get(value, "")
+    if type(value) is int and 0 <= value <= 5:
+        return PRIORITY_ICONS[value] or ""
+    return ""
 
 
 # ---------------------------------------------------------------------------
 # Task status
 # ---------------------------------------------------------------------------
 
+# Indexed by TickTick task status: 0 = active, 2 = completed.
+_STATUS_LABELS = ("Active", None, "Completed")
+
+
 def task_status_label(status: int) -> str:
     """Convert TickTick task status to label."""
-    if status == 0:
-        return "Active"
-    if status == 2:
-        return "Completed"
+    if type(status) is int and 0 <= status <= 2 and _STATUS_LABELS[status] is not None:
+        return _STATUS_LABELS[status]
     return f"Status({status})"
 
 
@@ -57,16 +59,22 @@ def task_status_label(status: int) -> str:
 # Markdown formatters
 # ---------------------------------------------------------------------------
 
-def format_project_md(project: dict) -> str:
-    """Format a single project as Markdown."""
-    lines = [f"## {project.get('name', 'Unnamed')}"]
-    lines.append(f"- **ID**: `{project.get('id', '?')}`")
+def _project_md_into(project: dict, out: list[str]) -> None:
+    """Append a project's Markdown lines to `out`."""
+    out.append(f"## {project.get('name', 'Unnamed')}")
+    out.append(f"- **ID**: `{project.get('id', '?')}`")
     if project.get("color"):
-        lines.append(f"- **Color**: {project['color']}")
+        out.append(f"- **Color**: {project['color']}")
     if project.get("viewMode"):
-        lines.append(f"- **View**: {project['viewMode']}")
+        out.append(f"- **View**: {project['viewMode']}")
     if project.get("kind"):
-        lines.append(f"- **Kind**: {project['kind']}")
+        out.append(f"- **Kind**: {project['kind']}")
+
+
+def format_project_md(project: dict) -> str:
+    """Format a single project as Markdown."""
+    lines: list[str] = []
+    _project_md_into(project, lines)
     return "\n".join(lines)
 
 
@@ -77,53 +85,116 @@ def format_projects_md(projects: list[dict]) -> str:
     lines = [f"# Projects ({len(projects)})"]
     for p in projects:
         lines.append("")
-        lines.append(format_project_md(p))
+        _project_md_into(p, lines)
     return "\n".join(lines)
 
 
-def format_task_md(task: dict) -> str:
-    """Format a single task as Markdown."""
+# Optional task fields, in display order: (API key, label, renderer).
+# Only fields present on the task are emitted.
+_TASK_DETAIL_FIELDS = (
+    ("content", "Content", lambda v: v[:200]),
+    ("dueDate", "Due", str),
+    ("startDate", "Start", str),
+    ("tags", "Tags", ", ".join),
+    ("timeZone", "Timezone", str),
+)
+
+
+def _task_md_into(task: dict, out: list[str]) -> None:
+    """Append a task's Markdown lines to `out`."""
     title = task.get("title", "Untitled")
     pri = task.get("priority", 0)
     icon = priority_icon(pri)
     status = task_status_label(task.get("status", 0))
 
-    lines = [f"## {icon} {title}".strip()]
-    lines.append(f"- **ID**: `{task.get('id', '?')}`")
-    lines.append(f"- **Project**: `{task.get('projectId', '?')}`")
-    lines.append(f"- **Priority**: {priority_label(pri)}")
-    lines.append(f"- **Status**: {status}")
-
-    if task.get("content"):
-        lines.append(f"- **Content**: {task['content'][:200]}")
-    if task.get("dueDate"):
-        lines.append(f"- **Due**: {task['dueDate']}")
-    if task.get("startDate"):
-        lines.append(f"- **Start**: {task['startDate']}")
-    if task.get("tags"):
-        lines.append(f"- **Tags**: {', '.join(task['tags'])}")
-    if task.get("timeZone"):
-        lines.append(f"- **Timezone**: {task['timeZone']}")
+    out.append(f"## {icon} {title}".strip())
+    out.append(f"- **ID**: `{task.get('id', '?')}`")
+    out.append(f"- **Project**: `{task.get('projectId', '?')}`")
+    out.append(f"- **Priority**: {priority_label(pri)}")
+    out.append(f"- **Status**: {status}")
+
+    get = task.get
+    for key, label, render in _TASK_DETAIL_FIELDS:
+        value = get(key)
+        if value:
+            out.append(f"- **{label}**: {render(value)}")
 
     items = task.get("items", [])
     if items:
-        lines.append(f"- **Subtasks** ({len(items)}):")
+        out.append(f"- **Subtasks** ({len(items)}):")
         for item in items:
             check = "x" if item.get("status", 0) == 1 else " "
-            lines.append(f"  - [{check}] {item.get('title', '?')}")
+            out.append(f"  - [{check}] {item.get('title', '?')}")
 
+
+def format_task_md(task: dict) -> str:
+    """Format a single task as Markdown."""
+    lines: list[str] = []
+    _task_md_into(task, lines)
     return "\n".join(lines)
 
 
-def format_tasks_md(tasks: list[dict], project_name: str = "") -> str:
-    """Format a list of tasks as Markdown."""
+def _tasks_md_into(
+    tasks: list[dict], project_name: str, out: list[str], max_chars: int | None
+) -> None:
+    """Append a task list's Markdown lines to `out`.
+
+    With max_chars, the budget covers everything already in `out` too.
+    """
     if not tasks:
-        return "No tasks found."
+        out.append("No tasks found.")
+        return
     header = f"# Tasks in {project_name}" if project_name else f"# Tasks ({len(tasks)})"
-    lines = [f"{header} ({len(tasks)})"]
-    for t in tasks:
-        lines.append("")
-        lines.append(format_task_md(t))
+    out.append(f"{header} ({len(tasks)})")
+    if max_chars is None:
+        for t in tasks:
+            out.append("")
+            _task_md_into(t, out)
+        return
+
+    budget = max_chars - _OMITTED_NOTE_RESERVE
+    size = sum(len(line) + 1 for line in out) - 1
+    for shown, t in enumerate(tasks):
+        start = len(out)
+        out.append("")
+        _task_md_into(t, out)
+        size += sum(len(line) + 1 for line in out[start:])
+        if size > budget:
+            del out[start:]
+            out.append("")
+            out.append(
+                f"_…{len(tasks) - shown:,} more tasks not shown. "
+                "Use filters to narrow the results._"
+            )
+            break
+
+
+def format_tasks_md(
+    tasks: list[dict], project_name: str = "", max_chars: int | None = None
+) -> str:
+    """Format a list of tasks as Markdown.
+
+    With max_chars, stops rendering once the next task would exceed the
+    budget and ends with a note on how many tasks were left out, instead
+    of formatting everything and truncating afterwards.
+    """
+    lines: list[str] = []
+    _tasks_md_into(tasks, project_name, lines, max_chars)
+    return "\n".join(lines)
+
+
+def format_project_with_tasks_md(
+    project: dict, tasks: list[dict], max_chars: int | None = None
+) -> str:
+    """Format a project followed by its tasks as one Markdown document.
+
+    Same output as format_projects_md([project]) + "\n\n" + format_tasks_md(...),
+    built in a single line list; max_chars covers the whole document.
+    """
+    lines = ["# Projects (1)", ""]
+    _project_md_into(project, lines)
+    lines.append("")
+    _tasks_md_into(tasks, project.get("name", "Unknown"), lines, max_chars)
     return "\n".join(lines)
 
 
@@ -132,7 +203,19 @@ def format_tasks_md(tasks: list[dict], project_name: str = "") -> str:
 # ---------------------------------------------------------------------------
 
 def format_json(data: Any) -> str:
-    """Format data as indented JSON string."""
+    """Format data as indented JSON string.
+
+    Uses orjson when installed; falls back to the stdlib encoder otherwise
+    (or for payloads orjson rejects). Non-string dict keys are stringified
+    either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
     return json.dumps(data, indent=2, ensure_ascii=False, default=str)
 
 
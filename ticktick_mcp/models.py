@@ -6,297 +6,289 @@ Field constraints catch bad input before it hits the API.
 
 from __future__ import annotations
 
-from enum import Enum
-from typing import Optional
+import re
+from datetime import date
+from typing import Annotated, Any, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints
 
 
 # ---------------------------------------------------------------------------
-# Enums
+# Choice types
 # ---------------------------------------------------------------------------
 
-class ResponseFormat(str, Enum):
+# String choices are Literals (validated by pydantic-core as set membership,
+# listed as an enum in the JSON schema). The classes below are plain name
+# namespaces so handlers can write ResponseFormat.JSON instead of "json".
+
+ResponseFormatType = Literal["markdown", "json"]
+ProjectViewModeType = Literal["list", "kanban", "timeline"]
+ProjectKindType = Literal["TASK", "NOTE"]
+FocusPeriod = Literal["today", "week", "month", "year"]
+
+
+class ResponseFormat:
     """Output format for tool responses."""
     MARKDOWN = "markdown"
     JSON = "json"
 
 
-class ProjectViewMode(str, Enum):
+class ProjectViewMode:
     """TickTick project view modes."""
     LIST = "list"
     KANBAN = "kanban"
     TIMELINE = "timeline"
 
 
-class ProjectKind(str, Enum):
+class ProjectKind:
     """TickTick project kinds."""
     TASK = "TASK"
     NOTE = "NOTE"
 
 
-class TaskPriority(int, Enum):
-    """TickTick task priority levels."""
-    NONE = 0
-    LOW = 1
-    MEDIUM = 3
-    HIGH = 5
+# TickTick task priority levels. A Literal validates as a plain int set
+# membership in pydantic-core and shows up as an enum in the JSON schema.
+TaskPriority = Literal[0, 1, 3, 5]
+TASK_PRIORITY_NONE = 0
+TASK_PRIORITY_LOW = 1
+TASK_PRIORITY_MEDIUM = 3
+TASK_PRIORITY_HIGH = 5
+
+
+# ---------------------------------------------------------------------------
+# Shared field types
+# ---------------------------------------------------------------------------
+
+# Short identifier-like strings (IDs, titles, names) are stripped; free-form
+# content is passed through untouched, so long task bodies aren't rescanned.
+Stripped = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+# One pattern for every color field; pydantic-core compiles it once per model
+# and it still shows up as "pattern" in the tool's JSON schema.
+HexColor = Annotated[str, StringConstraints(strip_whitespace=True, pattern=r"^#[0-9a-fA-F]{6}$")]
+
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+
+def _validate_iso_date(v: str) -> str:
+    if not _ISO_DATE_RE.match(v):
+        raise ValueError(
+            f"Date must be in ISO format 'yyyy-MM-ddTHH:mm:ssZ' (e.g., '2026-03-15T09:00:00+0000'), got: {v}"
+        )
+    return v
+
+
+IsoDate = Annotated[Stripped, AfterValidator(_validate_iso_date)]
+
+def _validate_date_stamp(v: int) -> int:
+    try:
+        date(v // 10000, v // 100 % 100, v % 100)
+    except ValueError:
+        raise ValueError(f"Not a real calendar date in YYYYMMDD format, got: {v}") from None
+    return v
+
+
+# V2 endpoints take calendar days as YYYYMMDD numbers (e.g., 20260213).
+DateStamp = Annotated[int, Field(ge=19700101, le=99991231), AfterValidator(_validate_date_stamp)]
 
 
 # ---------------------------------------------------------------------------
 # Shared model config
 # ---------------------------------------------------------------------------
 
+def _opt(description: str | None = None, **constraints: Any) -> Any:
+    """Optional field that defaults to None."""
+    return Field(default=None, description=description, **constraints)
+
+
 _STRICT_CONFIG = ConfigDict(
-    str_strip_whitespace=True,
-    validate_assignment=True,
     extra="forbid",
+    frozen=True,
 )
 
 
-# ---------------------------------------------------------------------------
-# Project models
-# ---------------------------------------------------------------------------
-
-class ListProjectsInput(BaseModel):
-    """Input for listing all projects."""
+class _InputModel(BaseModel):
+    """Base for all tool inputs: strict, immutable request DTOs."""
     model_config = _STRICT_CONFIG
 
-    response_format: ResponseFormat = Field(
+
+class FormatOnlyInput(_InputModel):
+    """Input for tools whose only option is the output format.
+
+    Shared by every such tool (ListProjectsInput, DailyStandupInput, ...)
+    so the identical schema is built once.
+    """
+    response_format: ResponseFormatType = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' (human-readable) or 'json' (machine-readable)",
     )
 
 
-class GetProjectInput(BaseModel):
-    """Input for getting a project with its tasks."""
-    model_config = _STRICT_CONFIG
+# ---------------------------------------------------------------------------
+# Project models
+# ---------------------------------------------------------------------------
+
+ListProjectsInput = FormatOnlyInput
+
 
-    project_id: str = Field(
+class GetProjectInput(_InputModel):
+    """Input for getting a project with its tasks."""
+    project_id: Stripped = Field(
         ...,
         description="TickTick project/list ID (e.g., '696d539b8f08e340f3116156')",
         min_length=1,
     )
-    response_format: ResponseFormat = Field(
+    response_format: ResponseFormatType = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' or 'json'",
     )
 
 
-class CreateProjectInput(BaseModel):
+class CreateProjectInput(_InputModel):
     """Input for creating a new project."""
-    model_config = _STRICT_CONFIG
-
-    name: str = Field(
+    name: Stripped = Field(
         ...,
         description="Project name (e.g., 'Work Tasks', 'Shopping List')",
         min_length=1,
         max_length=200,
     )
-    color: Optional[str] = Field(
-        default=None,
-        description="Hex color code (e.g., '#4772FA')",
-        pattern=r"^#[0-9a-fA-F]{6}$",
-    )
-    view_mode: ProjectViewMode = Field(
+    color: Optional[HexColor] = _opt("Hex color code (e.g., '#4772FA')")
+    view_mode: ProjectViewModeType = Field(
         default=ProjectViewMode.LIST,
         description="View mode: 'list', 'kanban', or 'timeline'",
     )
-    kind: ProjectKind = Field(
+    kind: ProjectKindType = Field(
         default=ProjectKind.TASK,
         description="Project kind: 'TASK' or 'NOTE'",
     )
 
 
-class UpdateProjectInput(BaseModel):
+class UpdateProjectInput(_InputModel):
     """Input for updating an existing project."""
-    model_config = _STRICT_CONFIG
-
-    project_id: str = Field(..., description="Project ID to update", min_length=1)
-    name: Optional[str] = Field(default=None, description="New project name", min_length=1, max_length=200)
-    color: Optional[str] = Field(default=None, description="New hex color (e.g., '#FF0000')", pattern=r"^#[0-9a-fA-F]{6}$")
-    view_mode: Optional[ProjectViewMode] = Field(default=None, description="New view mode")
-    kind: Optional[ProjectKind] = Field(default=None, description="New kind")
-    sort_order: Optional[int] = Field(default=None, description="Sort order (integer)")
+    project_id: Stripped = Field(..., description="Project ID to update", min_length=1)
+    name: Optional[Stripped] = _opt("New project name", min_length=1, max_length=200)
+    color: Optional[HexColor] = _opt("New hex color (e.g., '#FF0000')")
+    view_mode: Optional[ProjectViewModeType] = _opt("New view mode")
+    kind: Optional[ProjectKindType] = _opt("New kind")
+    sort_order: Optional[int] = _opt("Sort order (integer)")
 
 
-class DeleteProjectInput(BaseModel):
+class DeleteProjectInput(_InputModel):
     """Input for deleting a project."""
-    model_config = _STRICT_CONFIG
-
-    project_id: str = Field(..., description="Project ID to delete", min_length=1)
+    project_id: Stripped = Field(..., description="Project ID to delete", min_length=1)
 
 
 # ---------------------------------------------------------------------------
 # Task models
 # ---------------------------------------------------------------------------
 
-class GetTaskInput(BaseModel):
+class GetTaskInput(_InputModel):
     """Input for getting a single task."""
-    model_config = _STRICT_CONFIG
+    project_id: Stripped = Field(..., description="Project ID containing the task", min_length=1)
+    task_id: Stripped = Field(..., description="Task ID to retrieve", min_length=1)
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    project_id: str = Field(..., description="Project ID containing the task", min_length=1)
-    task_id: str = Field(..., description="Task ID to retrieve", min_length=1)
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-
-class SearchTasksInput(BaseModel):
+class SearchTasksInput(_InputModel):
     """Input for searching tasks within a project."""
-    model_config = _STRICT_CONFIG
-
-    project_id: str = Field(
+    project_id: Stripped = Field(
         ...,
         description="Project ID to search within",
         min_length=1,
     )
-    query: Optional[str] = Field(
-        default=None,
-        description="Text to search for in task titles and content (case-insensitive)",
-    )
-    priority: Optional[TaskPriority] = Field(
-        default=None,
-        description="Filter by priority: 0=none, 1=low, 3=medium, 5=high",
+    query: Optional[Stripped] = _opt(
+        "Words to search for in task titles and content (case-insensitive; all must match)",
     )
+    priority: Optional[TaskPriority] = _opt("Filter by priority: 0=none, 1=low, 3=medium, 5=high")
     include_completed: bool = Field(
         default=False,
         description="Include completed tasks in results (default: only active tasks)",
     )
-    response_format: ResponseFormat = Field(
+    response_format: ResponseFormatType = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format",
     )
 
 
-class SubtaskInput(BaseModel):
+class SubtaskInput(_InputModel):
     """A subtask (checklist item) within a task."""
-    model_config = _STRICT_CONFIG
-
-    title: str = Field(..., description="Subtask title", min_length=1, max_length=500)
+    title: Stripped = Field(..., description="Subtask title", min_length=1, max_length=500)
     status: int = Field(
         default=0,
         description="Completion status: 0=normal, 1=completed",
         ge=0,
         le=1,
     )
-    sort_order: Optional[int] = Field(default=None, description="Sort order")
+    sort_order: Optional[int] = _opt("Sort order")
 
 
-class CreateTaskInput(BaseModel):
+class CreateTaskInput(_InputModel):
     """Input for creating a new task."""
-    model_config = _STRICT_CONFIG
-
-    title: str = Field(
+    title: Stripped = Field(
         ...,
         description="Task title (e.g., 'Buy groceries', 'Review PR #42')",
         min_length=1,
         max_length=500,
     )
-    project_id: str = Field(
+    project_id: Stripped = Field(
         ...,
         description="Project ID to create the task in",
         min_length=1,
     )
-    content: Optional[str] = Field(
-        default=None,
-        description="Task body/notes (supports markdown)",
-        max_length=5000,
-    )
+    content: Optional[str] = _opt("Task body/notes (supports markdown)", max_length=5000)
     priority: TaskPriority = Field(
-        default=TaskPriority.NONE,
+        default=TASK_PRIORITY_NONE,
         description="Priority: 0=none, 1=low, 3=medium, 5=high",
     )
-    due_date: Optional[str] = Field(
-        default=None,
-        description="Due date in ISO format: 'yyyy-MM-ddTHH:mm:ssZ' (e.g., '2026-03-15T09:00:00+0000')",
-    )
-    start_date: Optional[str] = Field(
-        default=None,
-        description="Start date in ISO format: 'yyyy-MM-ddTHH:mm:ssZ'",
-    )
-    is_all_day: Optional[bool] = Field(
-        default=None,
-        description="Whether this is an all-day task",
+    due_date: Optional[IsoDate] = _opt(
+        "Due date in ISO format: 'yyyy-MM-ddTHH:mm:ssZ' (e.g., '2026-03-15T09:00:00+0000')",
     )
-    time_zone: Optional[str] = Field(
-        default=None,
-        description="Time zone (e.g., 'America/New_York', 'America/Detroit')",
+    start_date: Optional[IsoDate] = _opt("Start date in ISO format: 'yyyy-MM-ddTHH:mm:ssZ'")
+    is_all_day: Optional[bool] = _opt("Whether this is an all-day task")
+    time_zone: Optional[Stripped] = _opt("Time zone (e.g., 'America/New_York', 'America/Detroit')")
+    tags: Optional[list[Stripped]] = _opt("List of tag names (e.g., ['work', 'urgent'])")
+    subtasks: Optional[list[SubtaskInput]] = _opt("Checklist items / subtasks")
+    repeat_flag: Optional[Stripped] = _opt(
+        "Recurrence in iCalendar RFC 5545 format (e.g., 'RRULE:FREQ=DAILY;INTERVAL=1')",
     )
-    tags: Optional[list[str]] = Field(
-        default=None,
-        description="List of tag names (e.g., ['work', 'urgent'])",
-    )
-    subtasks: Optional[list[SubtaskInput]] = Field(
-        default=None,
-        description="Checklist items / subtasks",
-    )
-    repeat_flag: Optional[str] = Field(
-        default=None,
-        description="Recurrence in iCalendar RFC 5545 format (e.g., 'RRULE:FREQ=DAILY;INTERVAL=1')",
-    )
-    reminders: Optional[list[str]] = Field(
-        default=None,
-        description="Reminder triggers in iCalendar format (e.g., ['TRIGGER:PT0S', 'TRIGGER:P0DT9H0M0S'])",
+    reminders: Optional[list[Stripped]] = _opt(
+        "Reminder triggers in iCalendar format (e.g., ['TRIGGER:PT0S', 'TRIGGER:P0DT9H0M0S'])",
     )
 
-    @field_validator("due_date", "start_date")
-    @classmethod
-    def validate_date_format(cls, v: str | None) -> str | None:
-        if v is not None and "T" not in v:
-            raise ValueError(
-                f"Date must be in ISO format 'yyyy-MM-ddTHH:mm:ssZ' (e.g., '2026-03-15T09:00:00+0000'), got: {v}"
-            )
-        return v
 
-
-class UpdateTaskInput(BaseModel):
+class UpdateTaskInput(_InputModel):
     """Input for updating an existing task."""
-    model_config = _STRICT_CONFIG
-
-    task_id: str = Field(..., description="Task ID to update", min_length=1)
-    project_id: str = Field(..., description="Project ID containing the task", min_length=1)
-    title: Optional[str] = Field(default=None, description="New task title", min_length=1, max_length=500)
-    content: Optional[str] = Field(default=None, description="New task body/notes", max_length=5000)
-    priority: Optional[TaskPriority] = Field(default=None, description="New priority: 0=none, 1=low, 3=medium, 5=high")
-    due_date: Optional[str] = Field(default=None, description="New due date (ISO format)")
-    start_date: Optional[str] = Field(default=None, description="New start date (ISO format)")
-    is_all_day: Optional[bool] = Field(default=None, description="Whether this is an all-day task")
-    time_zone: Optional[str] = Field(default=None, description="Time zone")
-    tags: Optional[list[str]] = Field(default=None, description="New tags list")
-    subtasks: Optional[list[SubtaskInput]] = Field(default=None, description="New subtasks list (replaces existing)")
-    repeat_flag: Optional[str] = Field(default=None, description="New recurrence rule (iCalendar format)")
-    reminders: Optional[list[str]] = Field(default=None, description="New reminders (iCalendar format)")
-
-    @field_validator("due_date", "start_date")
-    @classmethod
-    def validate_date_format(cls, v: str | None) -> str | None:
-        if v is not None and "T" not in v:
-            raise ValueError(
-                f"Date must be in ISO format 'yyyy-MM-ddTHH:mm:ssZ', got: {v}"
-            )
-        return v
-
-
-class CompleteTaskInput(BaseModel):
+    task_id: Stripped = Field(..., description="Task ID to update", min_length=1)
+    project_id: Stripped = Field(..., description="Project ID containing the task", min_length=1)
+    title: Optional[Stripped] = _opt("New task title", min_length=1, max_length=500)
+    content: Optional[str] = _opt("New task body/notes", max_length=5000)
+    priority: Optional[TaskPriority] = _opt("New priority: 0=none, 1=low, 3=medium, 5=high")
+    due_date: Optional[IsoDate] = _opt("New due date (ISO format)")
+    start_date: Optional[IsoDate] = _opt("New start date (ISO format)")
+    is_all_day: Optional[bool] = _opt("Whether this is an all-day task")
+    time_zone: Optional[Stripped] = _opt("Time zone")
+    tags: Optional[list[Stripped]] = _opt("New tags list")
+    subtasks: Optional[list[SubtaskInput]] = _opt("New subtasks list (replaces existing)")
+    repeat_flag: Optional[Stripped] = _opt("New recurrence rule (iCalendar format)")
+    reminders: Optional[list[Stripped]] = _opt("New reminders (iCalendar format)")
+
+
+class CompleteTaskInput(_InputModel):
     """Input for completing a task."""
-    model_config = _STRICT_CONFIG
-
-    project_id: str = Field(..., description="Project ID containing the task", min_length=1)
-    task_id: str = Field(..., description="Task ID to complete", min_length=1)
+    project_id: Stripped = Field(..., description="Project ID containing the task", min_length=1)
+    task_id: Stripped = Field(..., description="Task ID to complete", min_length=1)
 
 
-class DeleteTaskInput(BaseModel):
+class DeleteTaskInput(_InputModel):
     """Input for deleting a task."""
-    model_config = _STRICT_CONFIG
+    project_id: Stripped = Field(..., description="Project ID containing the task", min_length=1)
+    task_id: Stripped = Field(..., description="Task ID to delete", min_length=1)
 
-    project_id: str = Field(..., description="Project ID containing the task", min_length=1)
-    task_id: str = Field(..., description="Task ID to delete", min_length=1)
 
-
-class BatchCreateTasksInput(BaseModel):
+class BatchCreateTasksInput(_InputModel):
     """Input for batch-creating multiple tasks."""
-    model_config = _STRICT_CONFIG
-
-    project_id: str = Field(
+    project_id: Stripped = Field(
         ...,
         description="Project ID to create all tasks in",
         min_length=1,
@@ -308,187 +300,156 @@ class BatchCreateTasksInput(BaseModel):
         max_length=50,
     )
 
-    @field_validator("tasks")
-    @classmethod
-    def override_project_ids(cls, v: list[CreateTaskInput], info) -> list[CreateTaskInput]:
-        """Ensure all tasks use the top-level project_id."""
-        # This validator runs after individual task validation.
-        # The top-level project_id is applied in the tool handler.
-        return v
 
-
-class MoveTaskInput(BaseModel):
+class MoveTaskInput(_InputModel):
     """Input for moving a task between projects."""
-    model_config = _STRICT_CONFIG
+    task_id: Stripped = Field(..., description="Task ID to move", min_length=1)
+    from_project_id: Stripped = Field(..., description="Current project ID", min_length=1)
+    to_project_id: Stripped = Field(..., description="Destination project ID", min_length=1)
+
 
-    task_id: str = Field(..., description="Task ID to move", min_length=1)
-    from_project_id: str = Field(..., description="Current project ID", min_length=1)
-    to_project_id: str = Field(..., description="Destination project ID", min_length=1)
+class BatchMoveTasksInput(_InputModel):
+    """Input for moving several tasks into one project."""
+    to_project_id: Stripped = Field(..., description="Destination project ID", min_length=1)
+    task_ids: list[Stripped] = Field(
+        ...,
+        description="IDs of the tasks to move (from any project)",
+        min_length=1,
+        max_length=50,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Smart Query Models (Phase 2)
 # ---------------------------------------------------------------------------
 
-class GetTasksDueTodayInput(BaseModel):
-    """Input for listing tasks due today across all projects."""
-    model_config = _STRICT_CONFIG
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+GetTasksDueTodayInput = FormatOnlyInput
 
 
-class GetOverdueTasksInput(BaseModel):
+class GetOverdueTasksInput(_InputModel):
     """Input for listing overdue tasks across all projects."""
-    model_config = _STRICT_CONFIG
     include_no_date: bool = Field(
         default=False,
         description="Include tasks with no due date (often forgotten tasks)",
     )
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
-class SearchAllTasksInput(BaseModel):
+class SearchAllTasksInput(_InputModel):
     """Input for searching tasks across ALL projects."""
-    model_config = _STRICT_CONFIG
-    query: str = Field(min_length=1, max_length=200, description="Text to search in title and content")
-    priority: TaskPriority | None = Field(default=None)
+    query: Stripped = Field(min_length=1, max_length=200, description="Words to search in title and content (all must match)")
+    priority: TaskPriority | None = _opt()
     include_completed: bool = Field(default=False)
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    max_results: int | None = _opt(
+        "Stop once this many matches are found (skips the remaining projects)",
+        ge=1, le=200,
+    )
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
-class GetEngagedTasksInput(BaseModel):
+class GetEngagedTasksInput(_InputModel):
     """Input for GTD 'Engaged' list: high priority OR overdue."""
-    model_config = _STRICT_CONFIG
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    limit: int | None = _opt("Only return the top N engaged tasks (by priority, then due date)", ge=1, le=500)
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
-class PlanDayInput(BaseModel):
+class PlanDayInput(_InputModel):
     """Input for day planning tool."""
-    model_config = _STRICT_CONFIG
     available_hours: float = Field(
         ge=0.5, le=24.0,
         description="How many hours of work time you have today",
     )
-    priorities: list[str] | None = Field(
-        default=None,
-        description="Optional: project names or tags to prioritize",
-    )
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    priorities: list[Stripped] | None = _opt("Optional: project names or tags to prioritize")
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
 # ---------------------------------------------------------------------------
 # Daily Standup & Review Models (Phase 3)
 # ---------------------------------------------------------------------------
 
-class DailyStandupInput(BaseModel):
-    """Input for daily standup briefing."""
-    model_config = _STRICT_CONFIG
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+DailyStandupInput = FormatOnlyInput
 
 
-class WeeklyReviewInput(BaseModel):
+class WeeklyReviewInput(_InputModel):
     """Input for weekly review analysis."""
-    model_config = _STRICT_CONFIG
     week_offset: int = Field(
         default=0,
         ge=-52, le=0,
         description="0 = this week, -1 = last week, etc.",
     )
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
 # ---------------------------------------------------------------------------
 # Focus / Pomodoro Models (Phase 4)
 # ---------------------------------------------------------------------------
 
-class GetFocusStatsInput(BaseModel):
+class GetFocusStatsInput(_InputModel):
     """Input for focus/pomodoro statistics."""
-    model_config = _STRICT_CONFIG
-    period: str = Field(
+    period: FocusPeriod = Field(
         default="today",
         description="Time period: 'today', 'week', 'month', or 'year'",
-        pattern="^(today|week|month|year)$",
     )
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
-class GetFocusHeatmapInput(BaseModel):
+class GetFocusHeatmapInput(_InputModel):
     """Input for focus duration heatmap."""
-    model_config = _STRICT_CONFIG
-    date_from: str = Field(description="Start date in YYYYMMDD format (e.g., '20260201')")
-    date_to: str = Field(description="End date in YYYYMMDD format (e.g., '20260213')")
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    date_from: DateStamp = Field(description="Start date in YYYYMMDD format (e.g., 20260201)")
+    date_to: DateStamp = Field(description="End date in YYYYMMDD format (e.g., 20260213)")
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
-class GetFocusDistributionInput(BaseModel):
+class GetFocusDistributionInput(_InputModel):
     """Input for focus time distribution by tag."""
-    model_config = _STRICT_CONFIG
-    date_from: str = Field(description="Start date in YYYYMMDD format")
-    date_to: str = Field(description="End date in YYYYMMDD format")
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    date_from: DateStamp = Field(description="Start date in YYYYMMDD format")
+    date_to: DateStamp = Field(description="End date in YYYYMMDD format")
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
-class GetProductivityScoreInput(BaseModel):
-    """Input for productivity score and general statistics."""
-    model_config = _STRICT_CONFIG
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+GetProductivityScoreInput = FormatOnlyInput
 
 
 # ---------------------------------------------------------------------------
 # Habit Models (Phase 5)
 # ---------------------------------------------------------------------------
 
-class ListHabitsInput(BaseModel):
-    """Input for listing all habits."""
-    model_config = _STRICT_CONFIG
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+ListHabitsInput = FormatOnlyInput
 
 
-class CheckinHabitInput(BaseModel):
+class CheckinHabitInput(_InputModel):
     """Input for checking in a habit."""
-    model_config = _STRICT_CONFIG
-    habit_id: str = Field(min_length=1, description="Habit ID")
-    date: str | None = Field(
-        default=None,
-        description="Date in YYYYMMDD format (defaults to today)",
-    )
-    value: float | None = Field(
-        default=None,
-        description="For quantitative habits (e.g., glasses of water). Omit for boolean habits.",
-    )
+    habit_id: Stripped = Field(min_length=1, description="Habit ID")
+    date: DateStamp | None = _opt("Date in YYYYMMDD format (defaults to today)")
+    value: float | None = _opt("For quantitative habits (e.g., glasses of water). Omit for boolean habits.")
 
 
-class GetHabitStatsInput(BaseModel):
+class GetHabitStatsInput(_InputModel):
     """Input for habit statistics."""
-    model_config = _STRICT_CONFIG
-    habit_id: str = Field(min_length=1, description="Habit ID")
+    habit_id: Stripped = Field(min_length=1, description="Habit ID")
     days: int = Field(
         default=30,
         ge=7, le=365,
         description="Number of days of history to analyze",
     )
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+    response_format: ResponseFormatType = Field(default=ResponseFormat.MARKDOWN)
 
 
 # ---------------------------------------------------------------------------
 # Tag Models (Phase 6)
 # ---------------------------------------------------------------------------
 
-class ListTagsInput(BaseModel):
-    """Input for listing all tags."""
-    model_config = _STRICT_CONFIG
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
+ListTagsInput = FormatOnlyInput
 
 
-class CreateTagInput(BaseModel):
+class CreateTagInput(_InputModel):
     """Input for creating a tag."""
-    model_config = _STRICT_CONFIG
-    name: str = Field(min_length=1, max_length=100, description="Tag name")
-    color: str | None = Field(default=None, pattern=r"^#[0-9a-fA-F]{6}$")
-    parent: str | None = Field(default=None, description="Parent tag name for nesting")
+    name: Stripped = Field(min_length=1, max_length=100, description="Tag name")
+    color: HexColor | None = _opt()
+    parent: Stripped | None = _opt("Parent tag name for nesting")
 
 
-class RenameTagInput(BaseModel):
+class RenameTagInput(_InputModel):
     """Input for renaming a tag."""
-    model_config = _STRICT_CONFIG
-    old_name: str = Field(min_length=1, description="Current tag name")
-    new_name: str = Field(min_length=1, description="New tag name")
+    old_name: Stripped = Field(min_length=1, description="Current tag name")
+    new_name: Stripped = Field(min_length=1, description="New tag name")
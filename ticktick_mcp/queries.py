@@ -6,68 +6,128 @@ They are pure functions (no I/O) for easy testing.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone, date, timedelta
+import heapq
+import re
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timezone, timedelta
+from functools import lru_cache
 
 
 def parse_date(date_str: str | None) -> datetime | None:
     """Parse a TickTick date string to datetime. Returns None if unparseable."""
     if not date_str:
         return None
+    return _parse_due(date_str)
+
+
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?"
+    r"(?:(Z)|([+-])(\d{2}):?(\d{2}))?$"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_due(date_str: str) -> datetime | None:
+    """Cached parser behind parse_date, keyed on the raw string.
+
+    Tasks often share due dates and the same list is run through several
+    filters per tool call, so each distinct string is parsed only once.
+    """
     try:
-        # TickTick uses format like "2026-02-13T09:00:00+0000"
-        # Also handles "2026-02-13T09:00:00.000+0000"
-        cleaned = date_str.replace(".000", "")
-        if cleaned.endswith("+0000") or cleaned.endswith("-0000"):
-            cleaned = cleaned[:-5] + "+00:00"
-        return datetime.fromisoformat(cleaned)
+        # Fast paths for TickTick's two canonical shapes, by length:
+        # "2026-02-13T09:00:00+0000" (24) and "2026-02-13T09:00:00.000+0000" (28)
+        n = len(date_str)
+        if (n == 24 or (n == 28 and date_str[19] == ".")) and date_str[10] == "T" \
+                and date_str[n - 5] in "+-":
+            offset = int(date_str[n - 4:n - 2]) * 60 + int(date_str[n - 2:])
+            tz = timezone.utc if offset == 0 else timezone(
+                timedelta(minutes=-offset if date_str[n - 5] == "-" else offset)
+            )
+            return datetime(
+                int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+                int(date_str[20:23]) * 1000 if n == 28 else 0,
+                tzinfo=tz,
+            )
+        # Other shapes: other fraction lengths, "Z", or colon offsets;
+        # one regex match instead of string rewrites
+        m = _DATE_RE.match(date_str)
+        if m is None:
+            return datetime.fromisoformat(date_str)
+        year, month, day, hour, minute, second, frac, zulu, sign, off_h, off_m = m.groups()
+        tz = None
+        if zulu:
+            tz = timezone.utc
+        elif sign:
+            offset = int(off_h) * 60 + int(off_m)
+            tz = timezone.utc if offset == 0 else timezone(
+                timedelta(minutes=-offset if sign == "-" else offset)
+            )
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int(frac.ljust(6, "0")) if frac else 0,
+            tzinfo=tz,
+        )
     except (ValueError, TypeError):
         return None
 
 
+def _clear_date_caches() -> None:
+    """Clear every cache derived from date strings (parses and sort keys)."""
+    _parse_due.cache_clear()
+    _due_epoch.cache_clear()
+
+
+# Expose the cache controls on the public function (e.g. for tests).
+parse_date.cache_clear = _clear_date_caches
+parse_date.cache_info = _parse_due.cache_info
+
+
 def is_active(task: dict) -> bool:
     """Check if task is not completed (status != 2)."""
-    return task.get("status", 0) != 2
+    return task.get("status") != 2
 
 
-def filter_overdue_tasks(tasks: list[dict]) -> list[dict]:
-    """Return active tasks with due dates in the past."""
-    now = datetime.now(timezone.utc)
-    result = []
+def _select(tasks: list[dict], keep: Callable[[datetime], bool]) -> list[dict]:
+    """Active, dated tasks whose due datetime passes `keep`, sorted by priority then date.
+
+    One filtering pass; the sort keys then hit the same parse caches.
+    """
+    picked: list[dict] = []
+    # Hoist global/attribute lookups out of the per-task loop
+    append, parse = picked.append, _parse_due
     for t in tasks:
-        if not is_active(t):
+        # Cheapest rejections first: completed, then undated, then the parse.
+        # A missing status means active, and None != 2, so no default needed.
+        if t.get("status") == 2:
             continue
-        due = parse_date(t.get("dueDate"))
-        if due and due < now:
-            result.append(t)
-    return sort_by_priority_then_date(result)
+        due_str = t.get("dueDate")
+        if not due_str:
+            continue
+        due = parse(due_str)
+        if due is not None and keep(due):
+            append(t)
+    _sort_in_place(picked)
+    return picked
 
 
-def filter_due_today(tasks: list[dict]) -> list[dict]:
-    """Return active tasks due today."""
-    today = date.today()
-    result = []
-    for t in tasks:
-        if not is_active(t):
-            continue
-        due = parse_date(t.get("dueDate"))
-        if due and due.date() == today:
-            result.append(t)
-    return sort_by_priority_then_date(result)
+def filter_overdue_tasks(tasks: list[dict], now: datetime | None = None) -> list[dict]:
+    """Return active tasks with due dates before `now` (default: current time)."""
+    now = now or datetime.now(timezone.utc)
+    return _select(tasks, lambda due: due < now)
 
 
-def filter_due_this_week(tasks: list[dict]) -> list[dict]:
+def filter_due_today(tasks: list[dict], now: datetime | None = None) -> list[dict]:
+    """Return active tasks due today (the UTC date of `now`, default: current time)."""
+    today = (now or datetime.now(timezone.utc)).toordinal()
+    return _select(tasks, lambda due: due.toordinal() == today)
+
+
+def filter_due_this_week(tasks: list[dict], now: datetime | None = None) -> list[dict]:
     """Return active tasks due within the next 7 days (excluding today)."""
-    now = datetime.now(timezone.utc)
-    today = now.date()
-    week_end = today + timedelta(days=7)
-    result = []
-    for t in tasks:
-        if not is_active(t):
-            continue
-        due = parse_date(t.get("dueDate"))
-        if due and today < due.date() <= week_end:
-            result.append(t)
-    return sort_by_priority_then_date(result)
+    today = (now or datetime.now(timezone.utc)).toordinal()
+    week_end = today + 7
+    return _select(tasks, lambda due: today < due.toordinal() <= week_end)
 
 
 def filter_completed_since(tasks: list[dict], since: datetime) -> list[dict]:
@@ -82,36 +142,198 @@ def filter_completed_since(tasks: list[dict], since: datetime) -> list[dict]:
     return result
 
 
-def filter_engaged(tasks: list[dict]) -> list[dict]:
-    """GTD 'Engaged' list: high priority OR overdue."""
-    now = datetime.now(timezone.utc)
-    result = []
+def filter_engaged(
+    tasks: list[dict], limit: int | None = None, now: datetime | None = None
+) -> list[dict]:
+    """GTD 'Engaged' list: high priority OR overdue.
+
+    With a limit, only the top `limit` tasks are selected (heap, no full sort).
+    """
+    now = now or datetime.now(timezone.utc)
+    engaged = (
+        t for t in tasks
+        if is_active(t) and (
+            t.get("priority", 0) >= 5
+            or ((due := parse_date(t.get("dueDate"))) is not None and due < now)
+        )
+    )
+    return sort_by_priority_then_date(engaged, limit)
+
+
+def filter_day_candidates(tasks: list[dict], now: datetime | None = None) -> list[dict]:
+    """Active tasks that are high priority, overdue, or due today.
+
+    One pass over the list; same set as combining filter_overdue_tasks,
+    filter_due_today and the high-priority tasks, sorted by priority then date.
+    """
+    now = now or datetime.now(timezone.utc)
+    today = now.toordinal()
+    picked: list[dict] = []
+    append, parse = picked.append, _parse_due
     for t in tasks:
-        if not is_active(t):
+        if t.get("status") == 2:
             continue
-        is_high = t.get("priority", 0) >= 5
-        due = parse_date(t.get("dueDate"))
-        is_overdue = due is not None and due < now
-        if is_high or is_overdue:
-            result.append(t)
-    return sort_by_priority_then_date(result)
+        if (t.get("priority", 0) or 0) >= 5:
+            append(t)
+            continue
+        due_str = t.get("dueDate")
+        if due_str and (due := parse(due_str)) is not None and (
+            due < now or due.toordinal() == today
+        ):
+            append(t)
+    _sort_in_place(picked)
+    return picked
 
 
-def sort_by_priority_then_date(tasks: list[dict]) -> list[dict]:
-    """Sort tasks by priority (desc) then due date (asc, None last)."""
-    def sort_key(t):
-        priority = -(t.get("priority", 0))
-        due = parse_date(t.get("dueDate"))
-        date_key = due.isoformat() if due else "9999"
-        return (priority, date_key)
-    return sorted(tasks, key=sort_key)
+def categorize_tasks(
+    tasks: list[dict], now: datetime, completed_since: datetime | None = None
+) -> dict[str, list[dict]]:
+    """Bucket tasks by due date in a single pass.
 
+    Returns a dict with 'overdue', 'today', 'this_week' and 'no_date' lists
+    of active tasks, matching filter_overdue_tasks / filter_due_today /
+    filter_due_this_week (a task due earlier today is both overdue and due
+    today). With completed_since, a 'completed' list matching
+    filter_completed_since is filled in the same pass. Buckets keep input
+    order; callers sort as needed.
+    """
+    today = now.toordinal()
+    week_end = today + 7
+    overdue: list[dict] = []
+    due_today: list[dict] = []
+    this_week: list[dict] = []
+    no_date: list[dict] = []
+    completed: list[dict] = []
+    parse = parse_date
+    for t in tasks:
+        if t.get("status") == 2:
+            if completed_since is not None:
+                done = parse(t.get("completedTime"))
+                if done and done >= completed_since:
+                    completed.append(t)
+            continue
+        due = parse(t.get("dueDate"))
+        if due is None:
+            no_date.append(t)
+            continue
+        if due < now:
+            overdue.append(t)
+        due_day = due.toordinal()
+        if due_day == today:
+            due_today.append(t)
+        elif today < due_day <= week_end:
+            this_week.append(t)
+    buckets = {
+        "overdue": overdue,
+        "today": due_today,
+        "this_week": this_week,
+        "no_date": no_date,
+    }
+    if completed_since is not None:
+        buckets["completed"] = completed
+    return buckets
 
-def search_tasks(tasks: list[dict], query: str) -> list[dict]:
-    """Case-insensitive search in task title and content."""
-    q = query.lower()
-    return [
-        t for t in tasks
-        if q in t.get("title", "").lower()
-        or q in t.get("content", "").lower()
-    ]
+
+# Sorting is two stable passes (due date asc, then priority desc) with
+# cheap single-value keys; measured faster than one composite key, since
+# both keys come straight from a dict lookup or a cache hit.
+_NO_DUE = float("inf")
+
+
+@lru_cache(maxsize=4096)
+def _due_epoch(date_str: str) -> float:
+    due = _parse_due(date_str)
+    return due.timestamp() if due else _NO_DUE
+
+
+def _due_key(t: dict) -> float:
+    due_str = t.get("dueDate")
+    return _due_epoch(due_str) if due_str else _NO_DUE
+
+
+def _priority_key(t: dict) -> int:
+    return t.get("priority", 0) or 0
+
+
+def _priority_date_key(t: dict) -> tuple[int, float]:
+    """Composite key (priority desc, due asc, None last) for heapq selection."""
+    return -_priority_key(t), _due_key(t)
+
+
+def _sort_in_place(tasks: list[dict]) -> None:
+    tasks.sort(key=_due_key)
+    tasks.sort(key=_priority_key, reverse=True)  # stable: keeps date order
+
+
+def sort_by_priority_then_date(tasks: list[dict], limit: int | None = None) -> list[dict]:
+    """Sort tasks by priority (desc) then due date (asc, None last).
+
+    Returns a new list. With a limit, only the first `limit` tasks are
+    selected (heap, no full sort); same result as slicing the full sort.
+    """
+    if limit is not None:
+        return heapq.nsmallest(limit, tasks, key=_priority_date_key)
+    result = list(tasks)
+    _sort_in_place(result)
+    return result
+
+
+def current_streak(stamps: Iterable[int | str]) -> int:
+    """Consecutive days of check-ins ending at the most recent one.
+
+    Stamps are habit check-in dates as YYYYMMDD (TickTick's checkinStamp);
+    duplicates and unparseable values are ignored.
+    """
+    days: set[int] = set()
+    for stamp in stamps:
+        try:
+            n = int(stamp)
+            days.add(date(n // 10000, n // 100 % 100, n % 100).toordinal())
+        except (TypeError, ValueError):
+            continue
+    if not days:
+        return 0
+    day = max(days)
+    streak = 0
+    while day in days:
+        streak += 1
+        day -= 1
+    return streak
+
+
+@lru_cache(maxsize=8192)
+def _search_text(title: str, content: str) -> str:
+    """Lowercased title + content, cached so repeat searches skip .lower().
+
+    Kept out of the task dicts so nothing extra leaks into JSON responses.
+    The NUL separator stops a query from matching across the two fields.
+    """
+    return f"{title}\0{content}".lower()
+
+
+def search_tasks(
+    tasks: list[dict],
+    query: str | None,
+    *,
+    priority: int | None = None,
+    include_completed: bool = True,
+) -> list[dict]:
+    """Case-insensitive search in task title and content.
+
+    A query of several words matches tasks containing every word, in any
+    order. Optionally also filters by exact priority and drops completed
+    tasks, all in a single pass.
+    """
+    terms = query.lower().split() if query else []
+    result = []
+    for t in tasks:
+        if not include_completed and t.get("status") == 2:
+            continue
+        if priority is not None and t.get("priority", 0) != priority:
+            continue
+        if terms:
+            text = _search_text(t.get("title") or "", t.get("content") or "")
+            if not all(term in text for term in terms):
+                continue
+        result.append(t)
+    return result
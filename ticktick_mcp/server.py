@@ -11,19 +11,23 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
-from typing import AsyncIterator
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, AsyncIterator
 
 from fastmcp import FastMCP, Context
 
 from ticktick_mcp.client import TickTickClient, TickTickAPIError
-from ticktick_mcp.v2_client import TickTickV2Client, V2AuthError
 from ticktick_mcp.formatting import (
+    CHARACTER_LIMIT,
     format_json,
     format_project_md,
+    format_project_with_tasks_md,
     format_projects_md,
     format_task_md,
     format_tasks_md,
@@ -31,6 +35,7 @@ from ticktick_mcp.formatting import (
 )
 from ticktick_mcp.models import (
     BatchCreateTasksInput,
+    BatchMoveTasksInput,
     CheckinHabitInput,
     CompleteTaskInput,
     CreateProjectInput,
@@ -63,9 +68,10 @@ from ticktick_mcp.models import (
     WeeklyReviewInput,
 )
 from ticktick_mcp.queries import (
-    filter_completed_since,
+    categorize_tasks,
+    current_streak,
+    filter_day_candidates,
     filter_due_today,
-    filter_due_this_week,
     filter_engaged,
     filter_overdue_tasks,
     parse_date,
@@ -73,8 +79,14 @@ from ticktick_mcp.queries import (
     sort_by_priority_then_date,
 )
 
+if TYPE_CHECKING:
+    from ticktick_mcp.v2_client import TickTickV2Client
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent V1 requests fanned out by a single tool call.
+FETCH_CONCURRENCY = int(os.getenv("TICKTICK_FETCH_CONCURRENCY", "8"))
+
 
 # ---------------------------------------------------------------------------
 # Lifespan — shared clients (V1 always, V2 when credentials available)
@@ -90,14 +102,17 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[dict]:
     client = TickTickClient()
     v2_client = None
 
-    # Try to create V2 client if credentials are available
+    # Try to create V2 client if credentials are available; the V2 module
+    # is only imported then, so V1-only setups never load it
     if os.getenv("TICKTICK_USERNAME") and os.getenv("TICKTICK_PASSWORD"):
+        from ticktick_mcp.v2_client import TickTickV2Client, V2AuthError
+
         try:
             v2_client = TickTickV2Client()
             await v2_client.authenticate()
             logger.info("V2 client authenticated successfully")
         except (ValueError, V2AuthError) as e:
-            logger.warning(f"V2 client unavailable: {e}")
+            logger.warning("V2 client unavailable: %s", e)
             v2_client = None
 
     try:
@@ -112,6 +127,21 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[dict]:
 # Server
 # ---------------------------------------------------------------------------
 
+# Shared MCP tool annotations; each tool adds its own "title". Every tool
+# talks to the TickTick API, so all are open-world.
+_READ_ONLY = MappingProxyType(
+    {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+)
+_WRITE = MappingProxyType(
+    {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+)
+_IDEMPOTENT_WRITE = MappingProxyType(
+    {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+)
+_DESTRUCTIVE = MappingProxyType(
+    {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": True, "openWorldHint": True}
+)
+
 mcp = FastMCP(
     "ticktick_mcp",
     instructions=(
@@ -131,29 +161,134 @@ mcp = FastMCP(
 # Error handler
 # ---------------------------------------------------------------------------
 
+_ERR_AUTH = (
+    "Error: Authentication failed. Your TickTick access token may be "
+    "expired or invalid. Get a new token at https://developer.ticktick.com"
+)
+_ERR_PERM = "Error: Permission denied. Check your OAuth scopes include 'tasks:write'."
+_ERR_NOTFOUND = (
+    "Error: Resource not found. Check that the project_id and task_id are correct. "
+    "Use ticktick_list_projects to find valid project IDs."
+)
+_ERR_RATE = "Error: Rate limit exceeded. Wait a moment before retrying."
+_STATUS_MESSAGES = {401: _ERR_AUTH, 403: _ERR_PERM, 404: _ERR_NOTFOUND, 429: _ERR_RATE}
+
+
 def _handle_error(e: Exception) -> str:
     """Convert exceptions to LLM-friendly error messages."""
     if isinstance(e, TickTickAPIError):
-        if e.status_code == 401:
-            return (
-                "Error: Authentication failed. Your TickTick access token may be "
-                "expired or invalid. Get a new token at https://developer.ticktick.com"
-            )
-        if e.status_code == 403:
-            return "Error: Permission denied. Check your OAuth scopes include 'tasks:write'."
-        if e.status_code == 404:
-            return (
-                "Error: Resource not found. Check that the project_id and task_id are correct. "
-                "Use ticktick_list_projects to find valid project IDs."
-            )
-        if e.status_code == 429:
-            return "Error: Rate limit exceeded. Wait a moment before retrying."
+        message = _STATUS_MESSAGES.get(e.status_code)
+        if message is not None:
+            return message
         return f"Error: TickTick API returned status {e.status_code}: {e.detail}"
     if isinstance(e, ValueError):
         return f"Error: Invalid input — {e}"
     return f"Error: {type(e).__name__} — {e}"
 
 
+MAX_SEARCH_RESULTS = 200
+
+
+def _cap_results(tasks: list[dict], limit: int | None = None) -> tuple[list[dict], int]:
+    """Trim a task list to `limit` (default MAX_SEARCH_RESULTS) before formatting.
+
+    Returns (tasks_to_show, omitted_count).
+    """
+    limit = limit or MAX_SEARCH_RESULTS
+    omitted = len(tasks) - limit
+    if omitted <= 0:
+        return tasks, 0
+    return tasks[:limit], omitted
+
+
+def _omitted_note(omitted: int) -> str:
+    if not omitted:
+        return ""
+    return f"\n\n_{omitted:,} additional tasks omitted — refine your query._"
+
+
+def _render_task_list(
+    tasks: list[dict],
+    title: str,
+    response_format: str,
+    *,
+    omitted: int = 0,
+    note: str = "",
+    name_map: dict[str, str] | None = None,
+    **extra,
+) -> str:
+    """Shared JSON / Markdown output for tools that return a task list.
+
+    JSON is {"count", **extra, "tasks"} plus "omitted" when results were
+    capped; Markdown gets the omitted note and any extra `note` appended.
+    With name_map, JSON tasks carry their "_project_name".
+    """
+    if response_format == ResponseFormat.JSON:
+        if name_map is not None:
+            tasks = _tag_project_names(tasks, name_map)
+        payload = {"count": len(tasks), **extra, "tasks": tasks}
+        if omitted:
+            payload["omitted"] = omitted
+        return truncate_response(format_json(payload))
+    return truncate_response(
+        format_tasks_md(tasks, title, max_chars=CHARACTER_LIMIT) + _omitted_note(omitted) + note
+    )
+
+
+# Priority marker for plan/standup rows, indexed by priority 0-5:
+# high (5), medium (3-4), everything else.
+_BRIEFING_ICONS = ("⚪", "⚪", "⚪", "🟡", "🟡", "🔴")
+
+
+def _briefing_icon(priority: int) -> str:
+    if type(priority) is int and 0 <= priority <= 5:
+        return _BRIEFING_ICONS[priority]
+    return "🔴" if priority > 5 else "⚪"
+
+
+class _BudgetedLines:
+    """Report lines with a running CHARACTER_LIMIT budget.
+
+    Once a line would overflow the budget it is dropped along with
+    everything after it and a truncation marker is added, so rows past
+    the limit are never formatted. `extend` consumes generators lazily.
+    """
+
+    MARKER = "… (truncated)"
+
+    def __init__(self, max_chars: int = CHARACTER_LIMIT) -> None:
+        self.lines: list[str] = []
+        self.remaining = max_chars - len(self.MARKER)
+        self.full = False
+
+    def append(self, line: str) -> bool:
+        """Add a line; False (and no further lines) once the budget is spent."""
+        if self.full:
+            return False
+        # +1 for the newline joining it to the previous line
+        cost = len(line) + 1
+        if cost > self.remaining:
+            self.full = True
+            self.lines.append(self.MARKER)
+            return False
+        self.remaining -= cost
+        self.lines.append(line)
+        return True
+
+    def extend(self, lines, empty: str | None = None) -> None:
+        """Add lines until the budget runs out; `empty` is added if there were none."""
+        added = False
+        for line in lines:
+            added = True
+            if not self.append(line):
+                return
+        if not added and empty is not None:
+            self.append(empty)
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
 def _get_client(ctx) -> TickTickClient:
     """Extract the TickTick V1 client from request context."""
     return ctx.request_context.lifespan_context["ticktick"]
@@ -177,13 +312,7 @@ def _get_v2_client(ctx) -> TickTickV2Client:
 
 @mcp.tool(
     name="ticktick_list_projects",
-    annotations={
-        "title": "List TickTick Projects",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READ_ONLY, "title": "List TickTick Projects"},
 )
 async def ticktick_list_projects(params: ListProjectsInput, ctx: Context) -> str:
     """List all TickTick projects/lists for the authenticated user.
@@ -213,13 +342,7 @@ async def ticktick_list_projects(params: ListProjectsInput, ctx: Context) -> str
 
 @mcp.tool(
     name="ticktick_get_project",
-    annotations={
-        "title": "Get TickTick Project with Tasks",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READ_ONLY, "title": "Get TickTick Project with Tasks"},
 )
 async def ticktick_get_project(params: GetProjectInput, ctx: Context) -> str:
     """Get a TickTick project and all its tasks.
@@ -240,27 +363,24 @@ async def ticktick_get_project(params: GetProjectInput, ctx: Context) -> str:
     try:
         client = _get_client(ctx)
         data = await client.get_project_with_data(params.project_id)
+        tasks, omitted = _cap_results(data.get("tasks", []))
         if params.response_format == ResponseFormat.JSON:
+            if omitted:
+                data = {**data, "tasks": tasks, "omitted": omitted}
             return truncate_response(format_json(data))
 
-        project = data.get("project", data)
-        tasks = data.get("tasks", [])
-        name = project.get("name", "Unknown")
-        result = format_projects_md([project]) + "\n\n" + format_tasks_md(tasks, name)
-        return truncate_response(result)
+        note = _omitted_note(omitted)
+        result = format_project_with_tasks_md(
+            data.get("project", data), tasks, max_chars=CHARACTER_LIMIT - len(note)
+        )
+        return truncate_response(result + note)
     except Exception as e:
         return _handle_error(e)
 
 
 @mcp.tool(
     name="ticktick_create_project",
-    annotations={
-        "title": "Create TickTick Project",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": False,
-        "openWorldHint": True,
-    },
+    annotations={**_WRITE, "title": "Create TickTick Project"},
 )
 async def ticktick_create_project(params: CreateProjectInput, ctx: Context) -> str:
     """Create a new TickTick project/list.
@@ -281,9 +401,9 @@ async def ticktick_create_project(params: CreateProjectInput, ctx: Context) -> s
         if params.color:
             body["color"] = params.color
         if params.view_mode:
-            body["viewMode"] = params.view_mode.value
+            body["viewMode"] = params.view_mode
         if params.kind:
-            body["kind"] = params.kind.value
+            body["kind"] = params.kind
 
         result = await client.create_project(body)
         return f"Project created successfully.\n\n{format_project_md(result)}"
@@ -293,13 +413,7 @@ async def ticktick_create_project(params: CreateProjectInput, ctx: Context) -> s
 
 @mcp.tool(
     name="ticktick_update_project",
-    annotations={
-        "title": "Update TickTick Project",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_IDEMPOTENT_WRITE, "title": "Update TickTick Project"},
 )
 async def ticktick_update_project(params: UpdateProjectInput, ctx: Context) -> str:
     """Update an existing TickTick project's properties.
@@ -324,9 +438,9 @@ async def ticktick_update_project(params: UpdateProjectInput, ctx: Context) -> s
         if params.color is not None:
             body["color"] = params.color
         if params.view_mode is not None:
-            body["viewMode"] = params.view_mode.value
+            body["viewMode"] = params.view_mode
         if params.kind is not None:
-            body["kind"] = params.kind.value
+            body["kind"] = params.kind
         if params.sort_order is not None:
             body["sortOrder"] = params.sort_order
 
@@ -341,13 +455,7 @@ async def ticktick_update_project(params: UpdateProjectInput, ctx: Context) -> s
 
 @mcp.tool(
     name="ticktick_delete_project",
-    annotations={
-        "title": "Delete TickTick Project",
-        "readOnlyHint": False,
-        "destructiveHint": True,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_DESTRUCTIVE, "title": "Delete TickTick Project"},
 )
 async def ticktick_delete_project(params: DeleteProjectInput, ctx: Context) -> str:
     """Permanently delete a TickTick project and all its tasks.
@@ -375,13 +483,7 @@ async def ticktick_delete_project(params: DeleteProjectInput, ctx: Context) -> s
 
 @mcp.tool(
     name="ticktick_get_task",
-    annotations={
-        "title": "Get TickTick Task",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READ_ONLY, "title": "Get TickTick Task"},
 )
 async def ticktick_get_task(params: GetTaskInput, ctx: Context) -> str:
     """Get a single TickTick task by its project ID and task ID.
@@ -410,13 +512,7 @@ async def ticktick_get_task(params: GetTaskInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_search_tasks",
-    annotations={
-        "title": "Search TickTick Tasks",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READ_ONLY, "title": "Search TickTick Tasks"},
 )
 async def ticktick_search_tasks(params: SearchTasksInput, ctx: Context) -> str:
     """Search for tasks within a TickTick project.
@@ -440,42 +536,29 @@ async def ticktick_search_tasks(params: SearchTasksInput, ctx: Context) -> str:
     try:
         client = _get_client(ctx)
         data = await client.get_project_with_data(params.project_id)
-        tasks = data.get("tasks", [])
-        project_name = data.get("project", {}).get("name", "")
-
-        # Filter by completion status
-        if not params.include_completed:
-            tasks = [t for t in tasks if t.get("status", 0) != 2]
-
-        # Filter by text query (case-insensitive)
-        if params.query:
-            q = params.query.lower()
-            tasks = [
-                t for t in tasks
-                if q in (t.get("title", "").lower())
-                or q in (t.get("content", "").lower())
-            ]
-
-        # Filter by priority
-        if params.priority is not None:
-            tasks = [t for t in tasks if t.get("priority", 0) == params.priority.value]
+        tasks, omitted = _cap_results(search_tasks(
+            data.get("tasks", []),
+            params.query,
+            priority=params.priority,
+            include_completed=params.include_completed,
+        ))
 
         if params.response_format == ResponseFormat.JSON:
-            return truncate_response(format_json({"count": len(tasks), "tasks": tasks}))
-        return truncate_response(format_tasks_md(tasks, project_name))
+            payload = {"count": len(tasks), "tasks": tasks}
+            if omitted:
+                payload["omitted"] = omitted
+            return truncate_response(format_json(payload))
+        project_name = data.get("project", {}).get("name", "")
+        return truncate_response(
+            format_tasks_md(tasks, project_name, max_chars=CHARACTER_LIMIT) + _omitted_note(omitted)
+        )
     except Exception as e:
         return _handle_error(e)
 
 
 @mcp.tool(
     name="ticktick_create_task",
-    annotations={
-        "title": "Create TickTick Task",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": False,
-        "openWorldHint": True,
-    },
+    annotations={**_WRITE, "title": "Create TickTick Task"},
 )
 async def ticktick_create_task(params: CreateTaskInput, ctx: Context) -> str:
     """Create a new task in a TickTick project.
@@ -505,13 +588,7 @@ async def ticktick_create_task(params: CreateTaskInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_update_task",
-    annotations={
-        "title": "Update TickTick Task",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_IDEMPOTENT_WRITE, "title": "Update TickTick Task"},
 )
 async def ticktick_update_task(params: UpdateTaskInput, ctx: Context) -> str:
     """Update an existing TickTick task.
@@ -532,33 +609,9 @@ async def ticktick_update_task(params: UpdateTaskInput, ctx: Context) -> str:
     """
     try:
         client = _get_client(ctx)
-        body: dict = {"id": params.task_id, "projectId": params.project_id}
-        if params.title is not None:
-            body["title"] = params.title
-        if params.content is not None:
-            body["content"] = params.content
-        if params.priority is not None:
-            body["priority"] = params.priority.value
-        if params.due_date is not None:
-            body["dueDate"] = params.due_date
-        if params.start_date is not None:
-            body["startDate"] = params.start_date
-        if params.is_all_day is not None:
-            body["isAllDay"] = params.is_all_day
-        if params.time_zone is not None:
-            body["timeZone"] = params.time_zone
-        if params.tags is not None:
-            body["tags"] = params.tags
-        if params.subtasks is not None:
-            body["items"] = [
-                {"title": s.title, "status": s.status, **({"sortOrder": s.sort_order} if s.sort_order is not None else {})}
-                for s in params.subtasks
-            ]
-        if params.repeat_flag is not None:
-            body["repeatFlag"] = params.repeat_flag
-        if params.reminders is not None:
-            body["reminders"] = params.reminders
-
+        body = _apply_task_fields(
+            {"id": params.task_id, "projectId": params.project_id}, params, skip_empty=False
+        )
         result = await client.update_task(params.task_id, body)
         return f"Task updated successfully.\n\n{format_task_md(result)}"
     except Exception as e:
@@ -567,13 +620,7 @@ async def ticktick_update_task(params: UpdateTaskInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_complete_task",
-    annotations={
-        "title": "Complete TickTick Task",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_IDEMPOTENT_WRITE, "title": "Complete TickTick Task"},
 )
 async def ticktick_complete_task(params: CompleteTaskInput, ctx: Context) -> str:
     """Mark a TickTick task as completed.
@@ -597,13 +644,7 @@ async def ticktick_complete_task(params: CompleteTaskInput, ctx: Context) -> str
 
 @mcp.tool(
     name="ticktick_delete_task",
-    annotations={
-        "title": "Delete TickTick Task",
-        "readOnlyHint": False,
-        "destructiveHint": True,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_DESTRUCTIVE, "title": "Delete TickTick Task"},
 )
 async def ticktick_delete_task(params: DeleteTaskInput, ctx: Context) -> str:
     """Permanently delete a TickTick task.
@@ -626,13 +667,7 @@ async def ticktick_delete_task(params: DeleteTaskInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_batch_create_tasks",
-    annotations={
-        "title": "Batch Create TickTick Tasks",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": False,
-        "openWorldHint": True,
-    },
+    annotations={**_WRITE, "title": "Batch Create TickTick Tasks"},
 )
 async def ticktick_batch_create_tasks(params: BatchCreateTasksInput, ctx: Context) -> str:
     """Create multiple TickTick tasks at once in a single API call.
@@ -666,18 +701,13 @@ async def ticktick_batch_create_tasks(params: BatchCreateTasksInput, ctx: Contex
 
 @mcp.tool(
     name="ticktick_move_task",
-    annotations={
-        "title": "Move TickTick Task",
-        "readOnlyHint": False,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_IDEMPOTENT_WRITE, "title": "Move TickTick Task"},
 )
 async def ticktick_move_task(params: MoveTaskInput, ctx: Context) -> str:
     """Move a task from one project to another.
 
-    Fetches the task, updates its projectId, and saves it to the new project.
+    Sends a partial update with just the new projectId; the API keeps
+    every other field, so no prior fetch is needed.
 
     Args:
         params: Contains task_id, from_project_id, and to_project_id.
@@ -688,50 +718,147 @@ async def ticktick_move_task(params: MoveTaskInput, ctx: Context) -> str:
     Examples:
         - "Move task abc123 from Inbox to Work" -> task_id, from_project_id, to_project_id
     """
+    if params.from_project_id == params.to_project_id:
+        return f"Task `{params.task_id}` is already in project `{params.to_project_id}`."
     try:
         client = _get_client(ctx)
-        # Fetch the current task
-        task = await client.get_task(params.from_project_id, params.task_id)
-        # Update with new project ID
-        body = {
-            "id": params.task_id,
-            "projectId": params.to_project_id,
-            "title": task.get("title", ""),
-        }
+        body = {"id": params.task_id, "projectId": params.to_project_id}
         result = await client.update_task(params.task_id, body)
-        title = result.get("title", task.get("title", "?"))
+        title = result.get("title", params.task_id)
         return f"Task '{title}' moved from project `{params.from_project_id}` to `{params.to_project_id}`."
     except Exception as e:
         return _handle_error(e)
 
 
+@mcp.tool(
+    name="ticktick_batch_move_tasks",
+    annotations={**_IDEMPOTENT_WRITE, "title": "Batch Move TickTick Tasks"},
+)
+async def ticktick_batch_move_tasks(params: BatchMoveTasksInput, ctx: Context) -> str:
+    """Move several tasks into one project concurrently.
+
+    Each task gets the same partial projectId update as ticktick_move_task,
+    but all moves run in parallel so the whole batch takes about as long
+    as a single move.
+
+    Args:
+        params: Contains to_project_id and task_ids (max 50).
+
+    Returns:
+        Summary of moved tasks, listing any that failed.
+
+    Examples:
+        - "Move these 3 Inbox tasks to Work" -> to_project_id=..., task_ids=[...]
+    """
+    try:
+        client = _get_client(ctx)
+        sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def move_one(task_id: str) -> dict:
+            async with sem:
+                body = {"id": task_id, "projectId": params.to_project_id}
+                return await client.update_task(task_id, body)
+
+        results = await asyncio.gather(
+            *(move_one(task_id) for task_id in params.task_ids),
+            return_exceptions=True,
+        )
+        failed = [
+            (task_id, r) for task_id, r in zip(params.task_ids, results)
+            if isinstance(r, Exception)
+        ]
+        moved = len(results) - len(failed)
+        lines = [f"Moved {moved} of {len(results)} tasks to project `{params.to_project_id}`."]
+        for task_id, err in failed:
+            lines.append(f"- `{task_id}`: {_handle_error(err)}")
+        return "\n".join(lines)
+    except Exception as e:
+        return _handle_error(e)
+
+
 # ===================================================================
 # SMART QUERY TOOLS (Phase 2 — V1 only)
 # ===================================================================
 
 
+async def _fetch_project_data(
+    client: TickTickClient,
+    project_ids: list[str],
+    concurrency: int = FETCH_CONCURRENCY,
+) -> list[dict]:
+    """Fetch several projects' data concurrently, preserving input order.
+
+    A project that fails to load is logged and skipped (returned as an
+    empty project) so one bad list doesn't sink a cross-project tool; if
+    every fetch fails, the first error is raised.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(pid: str) -> dict:
+        async with sem:
+            return await client.get_project_with_data(pid)
+
+    results = await asyncio.gather(
+        *(fetch_one(pid) for pid in project_ids), return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    for pid, r in zip(project_ids, results):
+        if isinstance(r, BaseException):
+            logger.warning("Skipping project %s: %s", pid, r)
+    return [{} if isinstance(r, BaseException) else r for r in results]
+
+
+async def _fetch_all_tasks_v2(v2: TickTickV2Client) -> tuple[list[dict], dict[str, str]]:
+    """Fetch all tasks from all open projects with one V2 sync call."""
+    projects, tasks = await v2.get_all_tasks()
+    name_map = {p["id"]: p.get("name", "Unknown") for p in projects if not p.get("closed")}
+    # Same scope as the V1 fan-out: open projects only (no Inbox)
+    all_tasks = [t for t in tasks if t.get("projectId") in name_map]
+    return all_tasks, name_map
+
+
 async def _fetch_all_tasks(ctx) -> tuple[list[dict], dict[str, str]]:
-    """Fetch all tasks from all open projects. Returns (tasks, project_name_map)."""
+    """Fetch all tasks from all open projects. Returns (tasks, project_name_map).
+
+    Uses the single V2 sync call when V2 is configured, otherwise one V1
+    request per project. Project names are looked up in the map only for
+    tasks that get displayed (see _project_name).
+    """
+    v2 = ctx.request_context.lifespan_context.get("ticktick_v2")
+    if v2 is not None:
+        try:
+            return await _fetch_all_tasks_v2(v2)
+        except Exception as e:  # undocumented API; the V1 fan-out still works
+            logger.warning("V2 sync failed, falling back to V1: %s", e)
+
     client = _get_client(ctx)
-    projects = await client.get_projects()
+    projects = [p for p in await client.get_projects() if not p.get("closed")]
+    name_map = {p["id"]: p.get("name", "Unknown") for p in projects}
     all_tasks = []
-    name_map = {}
-    for p in projects:
-        if p.get("closed"):
-            continue
-        pid = p["id"]
-        name_map[pid] = p.get("name", "Unknown")
-        data = await client.get_project_with_data(pid)
-        tasks = data.get("tasks", [])
-        for t in tasks:
-            t["_project_name"] = p.get("name", "Unknown")
-        all_tasks.extend(tasks)
+    for data in await _fetch_project_data(client, list(name_map)):
+        all_tasks.extend(data.get("tasks", []))
     return all_tasks, name_map
 
 
+def _project_name(task: dict, name_map: dict[str, str], default: str = "") -> str:
+    """Name of the project a task belongs to."""
+    return name_map.get(task.get("projectId"), default)
+
+
+def _tag_project_names(tasks: list[dict], name_map: dict[str, str]) -> list[dict]:
+    """Copies of the tasks about to be returned as JSON, with "_project_name".
+
+    The originals can be shared with the client's read cache, so they are
+    never written to.
+    """
+    return [{**t, "_project_name": name_map.get(t.get("projectId"), "Unknown")} for t in tasks]
+
+
 @mcp.tool(
     name="ticktick_get_tasks_due_today",
-    annotations={"title": "Tasks Due Today", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Tasks Due Today"},
 )
 async def ticktick_get_tasks_due_today(params: GetTasksDueTodayInput, ctx: Context) -> str:
     """Get all tasks due today across every open project.
@@ -739,18 +866,16 @@ async def ticktick_get_tasks_due_today(params: GetTasksDueTodayInput, ctx: Conte
     Zero-parameter convenience tool. Returns tasks sorted by priority.
     """
     try:
-        all_tasks, _ = await _fetch_all_tasks(ctx)
+        all_tasks, name_map = await _fetch_all_tasks(ctx)
         due_today = filter_due_today(all_tasks)
-        if params.response_format == ResponseFormat.JSON:
-            return truncate_response(format_json({"count": len(due_today), "tasks": due_today}))
-        return truncate_response(format_tasks_md(due_today, "Due Today"))
+        return _render_task_list(due_today, "Due Today", params.response_format, name_map=name_map)
     except Exception as e:
         return _handle_error(e)
 
 
 @mcp.tool(
     name="ticktick_get_overdue_tasks",
-    annotations={"title": "Overdue Tasks", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Overdue Tasks"},
 )
 async def ticktick_get_overdue_tasks(params: GetOverdueTasksInput, ctx: Context) -> str:
     """Get all overdue tasks across every open project, sorted by priority then age.
@@ -758,18 +883,16 @@ async def ticktick_get_overdue_tasks(params: GetOverdueTasksInput, ctx: Context)
     Useful for morning reviews and identifying what needs immediate attention.
     """
     try:
-        all_tasks, _ = await _fetch_all_tasks(ctx)
+        all_tasks, name_map = await _fetch_all_tasks(ctx)
         overdue = filter_overdue_tasks(all_tasks)
-        if params.response_format == ResponseFormat.JSON:
-            return truncate_response(format_json({"count": len(overdue), "tasks": overdue}))
-        return truncate_response(format_tasks_md(overdue, "Overdue"))
+        return _render_task_list(overdue, "Overdue", params.response_format, name_map=name_map)
     except Exception as e:
         return _handle_error(e)
 
 
 @mcp.tool(
     name="ticktick_get_engaged_tasks",
-    annotations={"title": "Engaged Tasks (GTD)", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Engaged Tasks (GTD)"},
 )
 async def ticktick_get_engaged_tasks(params: GetEngagedTasksInput, ctx: Context) -> str:
     """GTD 'Engaged' list: tasks that are high priority OR overdue.
@@ -777,18 +900,16 @@ async def ticktick_get_engaged_tasks(params: GetEngagedTasksInput, ctx: Context)
     These are the tasks you should be actively working on right now.
     """
     try:
-        all_tasks, _ = await _fetch_all_tasks(ctx)
-        engaged = filter_engaged(all_tasks)
-        if params.response_format == ResponseFormat.JSON:
-            return truncate_response(format_json({"count": len(engaged), "tasks": engaged}))
-        return truncate_response(format_tasks_md(engaged, "Engaged (Do Now)"))
+        all_tasks, name_map = await _fetch_all_tasks(ctx)
+        engaged = filter_engaged(all_tasks, params.limit)
+        return _render_task_list(engaged, "Engaged (Do Now)", params.response_format, name_map=name_map)
     except Exception as e:
         return _handle_error(e)
 
 
 @mcp.tool(
     name="ticktick_search_all_tasks",
-    annotations={"title": "Search All Tasks", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Search All Tasks"},
 )
 async def ticktick_search_all_tasks(params: SearchAllTasksInput, ctx: Context) -> str:
     """Search for tasks across ALL open projects by title or content.
@@ -796,22 +917,87 @@ async def ticktick_search_all_tasks(params: SearchAllTasksInput, ctx: Context) -
     Unlike ticktick_search_tasks which requires a project_id, this searches everywhere.
     """
     try:
-        all_tasks, _ = await _fetch_all_tasks(ctx)
-        if not params.include_completed:
-            all_tasks = [t for t in all_tasks if t.get("status", 0) != 2]
-        matches = search_tasks(all_tasks, params.query)
-        if params.priority is not None:
-            matches = [t for t in matches if t.get("priority", 0) == params.priority.value]
-        if params.response_format == ResponseFormat.JSON:
-            return truncate_response(format_json({"count": len(matches), "query": params.query, "tasks": matches}))
-        return truncate_response(format_tasks_md(matches, f"Search: '{params.query}'"))
+        title = f"Search: '{params.query}'"
+        # With max_results and no V2 sync, search projects as they arrive
+        # and stop fetching once enough matches are in
+        if params.max_results and ctx.request_context.lifespan_context.get("ticktick_v2") is None:
+            matches, stopped_early = await _search_projects_until(ctx, params)
+            note = "\n\n_Stopped at max_results; some projects were not searched._" if stopped_early else ""
+            return _render_task_list(
+                matches, title, params.response_format,
+                note=note, query=params.query, stopped_early=stopped_early,
+            )
+
+        all_tasks, name_map = await _fetch_all_tasks(ctx)
+        matches, omitted = _cap_results(search_tasks(
+            all_tasks,
+            params.query,
+            priority=params.priority,
+            include_completed=params.include_completed,
+        ), params.max_results)
+        return _render_task_list(
+            matches, title, params.response_format,
+            omitted=omitted, name_map=name_map, query=params.query,
+        )
     except Exception as e:
         return _handle_error(e)
 
 
+async def _search_projects_until(
+    ctx, params: SearchAllTasksInput
+) -> tuple[list[dict], bool]:
+    """Search projects in the order their data arrives, up to params.max_results.
+
+    Returns (matches in project order, whether fetches were cut short).
+    """
+    client = _get_client(ctx)
+    projects = [p for p in await client.get_projects() if not p.get("closed")]
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def fetch_one(index: int, project: dict) -> tuple[int, dict, dict]:
+        async with sem:
+            return index, project, await client.get_project_with_data(project["id"])
+
+    pending = [asyncio.ensure_future(fetch_one(i, p)) for i, p in enumerate(projects)]
+    found: list[tuple[int, list[dict]]] = []
+    count = 0
+    errors: list[Exception] = []
+    try:
+        for next_done in asyncio.as_completed(pending):
+            try:
+                index, project, data = await next_done
+            except Exception as e:
+                logger.warning("Skipping project during search: %s", e)
+                errors.append(e)
+                continue
+            hits = search_tasks(
+                data.get("tasks", []),
+                params.query,
+                priority=params.priority,
+                include_completed=params.include_completed,
+            )
+            if hits:
+                # Tagged copies: the fetched dicts may live in the read cache
+                name = project.get("name", "Unknown")
+                hits = [{**t, "_project_name": name} for t in hits]
+                found.append((index, hits))
+                count += len(hits)
+                if count >= params.max_results:
+                    break
+    finally:
+        stopped_early = not all(f.done() for f in pending)
+        for f in pending:
+            f.cancel()
+    if projects and len(errors) == len(projects):
+        raise errors[0]
+    found.sort(key=itemgetter(0))
+    matches = [t for _, hits in found for t in hits]
+    return matches[:params.max_results], stopped_early or len(matches) > params.max_results
+
+
 @mcp.tool(
     name="ticktick_plan_day",
-    annotations={"title": "Plan My Day", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Plan My Day"},
 )
 async def ticktick_plan_day(params: PlanDayInput, ctx: Context) -> str:
     """Help structure your day from your task list.
@@ -821,21 +1007,8 @@ async def ticktick_plan_day(params: PlanDayInput, ctx: Context) -> str:
     that fits within your available hours. Flags if over-committed.
     """
     try:
-        all_tasks, _ = await _fetch_all_tasks(ctx)
-        overdue = filter_overdue_tasks(all_tasks)
-        due_today_tasks = filter_due_today(all_tasks)
-        high_pri = [t for t in all_tasks if t.get("priority", 0) >= 5 and t.get("status", 0) != 2]
-
-        # Deduplicate (a task can be both overdue and high priority)
-        seen = set()
-        candidates = []
-        for t in overdue + due_today_tasks + high_pri:
-            tid = t.get("id")
-            if tid not in seen:
-                seen.add(tid)
-                candidates.append(t)
-
-        candidates = sort_by_priority_then_date(candidates)
+        all_tasks, name_map = await _fetch_all_tasks(ctx)
+        candidates = filter_day_candidates(all_tasks)
 
         # Estimate time: default 25 min per task unless pomo estimate exists
         total_minutes = 0
@@ -847,8 +1020,8 @@ async def ticktick_plan_day(params: PlanDayInput, ctx: Context) -> str:
             est_minutes = est_pomos * 25
             total_minutes += est_minutes
 
-            icon = "🔴" if t.get("priority", 0) >= 5 else "🟡" if t.get("priority", 0) >= 3 else "⚪"
-            project = t.get("_project_name", "")
+            icon = _briefing_icon(t.get("priority", 0))
+            project = _project_name(t, name_map)
             over = " -- OVER BUDGET" if total_minutes > available_minutes else ""
             plan_lines.append(
                 f"{icon} {t.get('title', '?')} -- {project} ({est_minutes}min){over}"
@@ -878,7 +1051,7 @@ async def ticktick_plan_day(params: PlanDayInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_daily_standup",
-    annotations={"title": "Daily Standup Briefing", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Daily Standup Briefing"},
 )
 async def ticktick_daily_standup(params: DailyStandupInput, ctx: Context) -> str:
     """Morning briefing: overdue tasks, due today, completed yesterday, and this week's horizon.
@@ -887,66 +1060,56 @@ async def ticktick_daily_standup(params: DailyStandupInput, ctx: Context) -> str
     of what needs attention, what's coming, and what you accomplished.
     """
     try:
-        all_tasks, _ = await _fetch_all_tasks(ctx)
+        all_tasks, name_map = await _fetch_all_tasks(ctx)
         now = datetime.now(timezone.utc)
         yesterday = now - timedelta(days=1)
 
-        overdue = filter_overdue_tasks(all_tasks)
-        due_today_tasks = filter_due_today(all_tasks)
-        completed_yesterday = filter_completed_since(all_tasks, yesterday.replace(hour=0, minute=0, second=0))
-        coming_this_week = filter_due_this_week(all_tasks)
-
-        sections = []
-        sections.append(f"# Daily Standup -- {now.strftime('%A, %B %d, %Y')}\n")
-
-        # Overdue
-        sections.append(f"## OVERDUE ({len(overdue)} tasks)")
-        if overdue:
-            for t in overdue[:10]:
-                icon = "🔴" if t.get("priority", 0) >= 5 else "🟡" if t.get("priority", 0) >= 3 else "⚪"
-                project = t.get("_project_name", "")
-                due = t.get("dueDate", "")[:10] if t.get("dueDate") else "no date"
-                sections.append(f"  - {icon} **{t.get('title', '?')}** -- {project} (due {due})")
-        else:
-            sections.append("  None -- you're caught up!")
-
-        # Due Today
-        sections.append(f"\n## DUE TODAY ({len(due_today_tasks)} tasks)")
-        if due_today_tasks:
-            for t in due_today_tasks[:10]:
-                icon = "🔴" if t.get("priority", 0) >= 5 else "🟡" if t.get("priority", 0) >= 3 else "⚪"
-                project = t.get("_project_name", "")
-                sections.append(f"  - {icon} {t.get('title', '?')} -- {project}")
-        else:
-            sections.append("  Nothing due today.")
-
-        # Completed Yesterday
-        sections.append(f"\n## COMPLETED YESTERDAY ({len(completed_yesterday)} tasks)")
-        if completed_yesterday:
-            for t in completed_yesterday[:10]:
-                project = t.get("_project_name", "")
-                sections.append(f"  - {t.get('title', '?')} -- {project}")
-        else:
-            sections.append("  No completions yesterday.")
-
-        # Coming This Week
-        sections.append(f"\n## COMING THIS WEEK ({len(coming_this_week)} tasks)")
-        if coming_this_week:
-            for t in coming_this_week[:10]:
-                due = t.get("dueDate", "")[:10] if t.get("dueDate") else ""
-                project = t.get("_project_name", "")
-                sections.append(f"  - {t.get('title', '?')} -- {project} ({due})")
-        else:
-            sections.append("  Clear week ahead.")
-
-        return truncate_response("\n".join(sections))
+        buckets = categorize_tasks(
+            all_tasks, now, completed_since=yesterday.replace(hour=0, minute=0, second=0)
+        )
+        overdue = buckets["overdue"]
+        due_today_tasks = buckets["today"]
+        completed_yesterday = buckets["completed"]
+        coming_this_week = buckets["this_week"]
+
+        out = _BudgetedLines()
+        out.append(f"# Daily Standup -- {now.strftime('%A, %B %d, %Y')}\n")
+
+        # Each section: header, then up to 10 rows (or a placeholder line).
+        # Only those 10 are sorted out of each bucket (heap select, no full sort).
+        out.append(f"## OVERDUE ({len(overdue)} tasks)")
+        out.extend((
+            f"  - {_briefing_icon(t.get('priority', 0))} **{t.get('title', '?')}** -- "
+            f"{_project_name(t, name_map)} (due {(t.get('dueDate') or '')[:10] or 'no date'})"
+            for t in sort_by_priority_then_date(overdue, limit=10)
+        ), empty="  None -- you're caught up!")
+
+        out.append(f"\n## DUE TODAY ({len(due_today_tasks)} tasks)")
+        out.extend((
+            f"  - {_briefing_icon(t.get('priority', 0))} {t.get('title', '?')} -- {_project_name(t, name_map)}"
+            for t in sort_by_priority_then_date(due_today_tasks, limit=10)
+        ), empty="  Nothing due today.")
+
+        out.append(f"\n## COMPLETED YESTERDAY ({len(completed_yesterday)} tasks)")
+        out.extend((
+            f"  - {t.get('title', '?')} -- {_project_name(t, name_map)}"
+            for t in completed_yesterday[:10]
+        ), empty="  No completions yesterday.")
+
+        out.append(f"\n## COMING THIS WEEK ({len(coming_this_week)} tasks)")
+        out.extend((
+            f"  - {t.get('title', '?')} -- {_project_name(t, name_map)} ({(t.get('dueDate') or '')[:10]})"
+            for t in sort_by_priority_then_date(coming_this_week, limit=10)
+        ), empty="  Clear week ahead.")
+
+        return truncate_response(out.text())
     except Exception as e:
         return _handle_error(e)
 
 
 @mcp.tool(
     name="ticktick_weekly_review",
-    annotations={"title": "Weekly Review", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Weekly Review"},
 )
 async def ticktick_weekly_review(params: WeeklyReviewInput, ctx: Context) -> str:
     """End-of-week analysis: completed vs planned, overdue trends, project breakdown.
@@ -964,38 +1127,43 @@ async def ticktick_weekly_review(params: WeeklyReviewInput, ctx: Context) -> str
         week_start -= timedelta(days=week_start.weekday())
         week_end = week_start + timedelta(days=7)
 
-        completed_this_week = filter_completed_since(all_tasks, week_start)
-        completed_this_week = [t for t in completed_this_week
-                               if parse_date(t.get("completedTime", "")) is None
-                               or parse_date(t.get("completedTime", "")) < week_end]
-        overdue = filter_overdue_tasks(all_tasks)
+        # One pass buckets both lists; the week_end check reuses the cached parse
+        buckets = categorize_tasks(all_tasks, now, completed_since=week_start)
+        completed_this_week = [
+            t for t in buckets["completed"]
+            if (done := parse_date(t.get("completedTime"))) is None or done < week_end
+        ]
+        overdue = buckets["overdue"]
 
         # Group completed by project
         by_project: dict[str, int] = {}
         for t in completed_this_week:
-            pname = t.get("_project_name", name_map.get(t.get("projectId", ""), "Other"))
+            pname = _project_name(t, name_map, "Other")
             by_project[pname] = by_project.get(pname, 0) + 1
 
-        sections = []
+        out = _BudgetedLines()
         week_label = "This Week" if params.week_offset == 0 else f"Week of {week_start.strftime('%B %d')}"
-        sections.append(f"# Weekly Review -- {week_label}\n")
+        out.append(f"# Weekly Review -- {week_label}\n")
 
-        sections.append("## Summary")
-        sections.append(f"- **Completed:** {len(completed_this_week)} tasks")
-        sections.append(f"- **Currently Overdue:** {len(overdue)} tasks")
+        out.append("## Summary")
+        out.append(f"- **Completed:** {len(completed_this_week)} tasks")
+        out.append(f"- **Currently Overdue:** {len(overdue)} tasks")
 
-        sections.append("\n## Completed by Project")
-        for pname, count in sorted(by_project.items(), key=lambda x: -x[1]):
-            sections.append(f"  - {pname}: {count} tasks")
+        out.append("\n## Completed by Project")
+        out.extend(
+            f"  - {pname}: {count} tasks"
+            for pname, count in sorted(by_project.items(), key=itemgetter(1), reverse=True)
+        )
 
         if overdue:
-            sections.append(f"\n## Still Overdue ({len(overdue)})")
-            for t in overdue[:10]:
-                icon = "🔴" if t.get("priority", 0) >= 5 else "🟡"
-                due = t.get("dueDate", "")[:10] if t.get("dueDate") else ""
-                sections.append(f"  - {icon} {t.get('title', '?')} (due {due})")
+            out.append(f"\n## Still Overdue ({len(overdue)})")
+            out.extend(
+                f"  - {'🔴' if t.get('priority', 0) >= 5 else '🟡'} {t.get('title', '?')} "
+                f"(due {t.get('dueDate', '')[:10] if t.get('dueDate') else ''})"
+                for t in sort_by_priority_then_date(overdue, limit=10)
+            )
 
-        return truncate_response("\n".join(sections))
+        return truncate_response(out.text())
     except Exception as e:
         return _handle_error(e)
 
@@ -1007,7 +1175,7 @@ async def ticktick_weekly_review(params: WeeklyReviewInput, ctx: Context) -> str
 
 @mcp.tool(
     name="ticktick_get_focus_stats",
-    annotations={"title": "Focus Statistics", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Focus Statistics"},
 )
 async def ticktick_get_focus_stats(params: GetFocusStatsInput, ctx: Context) -> str:
     """Get Pomodoro/focus statistics for a time period.
@@ -1033,8 +1201,7 @@ async def ticktick_get_focus_stats(params: GetFocusStatsInput, ctx: Context) ->
             date_from = now.strftime("%Y0101")
             date_to = now.strftime("%Y%m%d")
 
-        heatmap = await v2.get_focus_heatmap(date_from, date_to)
-        distribution = await v2.get_focus_distribution(date_from, date_to)
+        heatmap, distribution = await v2.fetch_focus(date_from, date_to)
 
         if params.response_format == ResponseFormat.JSON:
             return format_json({"period": params.period, "heatmap": heatmap, "distribution": distribution})
@@ -1049,10 +1216,12 @@ async def ticktick_get_focus_stats(params: GetFocusStatsInput, ctx: Context) ->
 
         if distribution:
             lines.append("\n## By Tag")
-            for d in sorted(distribution, key=lambda x: -(x.get("duration", x.get("pomoDuration", 0)))):
+            # Read each entry's duration once, then sort on it
+            items = [(d.get("duration", d.get("pomoDuration", 0)), d) for d in distribution]
+            items.sort(key=itemgetter(0), reverse=True)
+            for seconds, d in items:
                 tag = d.get("tag", d.get("name", "Untagged"))
-                dur = d.get("duration", d.get("pomoDuration", 0)) / 60
-                lines.append(f"  - {tag}: {dur:.0f}min")
+                lines.append(f"  - {tag}: {seconds / 60:.0f}min")
 
         return truncate_response("\n".join(lines))
     except Exception as e:
@@ -1061,7 +1230,7 @@ async def ticktick_get_focus_stats(params: GetFocusStatsInput, ctx: Context) ->
 
 @mcp.tool(
     name="ticktick_get_focus_heatmap",
-    annotations={"title": "Focus Heatmap", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Focus Heatmap"},
 )
 async def ticktick_get_focus_heatmap(params: GetFocusHeatmapInput, ctx: Context) -> str:
     """Get daily focus duration heatmap for a date range.
@@ -1071,7 +1240,7 @@ async def ticktick_get_focus_heatmap(params: GetFocusHeatmapInput, ctx: Context)
     """
     try:
         v2 = _get_v2_client(ctx)
-        heatmap = await v2.get_focus_heatmap(params.date_from, params.date_to)
+        heatmap = await v2.get_focus_heatmap(str(params.date_from), str(params.date_to))
         if params.response_format == ResponseFormat.JSON:
             return format_json(heatmap)
         lines = [f"# Focus Heatmap ({params.date_from} -> {params.date_to})\n"]
@@ -1087,7 +1256,7 @@ async def ticktick_get_focus_heatmap(params: GetFocusHeatmapInput, ctx: Context)
 
 @mcp.tool(
     name="ticktick_get_focus_distribution",
-    annotations={"title": "Focus Distribution by Tag", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Focus Distribution by Tag"},
 )
 async def ticktick_get_focus_distribution(params: GetFocusDistributionInput, ctx: Context) -> str:
     """Get focus time broken down by tag for a date range.
@@ -1097,14 +1266,15 @@ async def ticktick_get_focus_distribution(params: GetFocusDistributionInput, ctx
     """
     try:
         v2 = _get_v2_client(ctx)
-        distribution = await v2.get_focus_distribution(params.date_from, params.date_to)
+        distribution = await v2.get_focus_distribution(str(params.date_from), str(params.date_to))
         if params.response_format == ResponseFormat.JSON:
             return format_json(distribution)
         lines = [f"# Focus Distribution ({params.date_from} -> {params.date_to})\n"]
-        total = sum(d.get("duration", d.get("pomoDuration", 0)) for d in distribution) if distribution else 0
-        for d in sorted(distribution or [], key=lambda x: -(x.get("duration", x.get("pomoDuration", 0)))):
+        items = [(d.get("duration", d.get("pomoDuration", 0)), d) for d in distribution or []]
+        total = sum(dur for dur, _ in items)
+        items.sort(key=itemgetter(0), reverse=True)
+        for dur, d in items:
             tag = d.get("tag", d.get("name", "Untagged"))
-            dur = d.get("duration", d.get("pomoDuration", 0))
             pct = (dur / total * 100) if total > 0 else 0
             lines.append(f"  - **{tag}**: {dur // 60}min ({pct:.0f}%)")
         return truncate_response("\n".join(lines))
@@ -1114,7 +1284,7 @@ async def ticktick_get_focus_distribution(params: GetFocusDistributionInput, ctx
 
 @mcp.tool(
     name="ticktick_get_productivity_score",
-    annotations={"title": "Productivity Score", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Productivity Score"},
 )
 async def ticktick_get_productivity_score(params: GetProductivityScoreInput, ctx: Context) -> str:
     """Get your TickTick productivity/achievement score and general statistics.
@@ -1151,7 +1321,7 @@ async def ticktick_get_productivity_score(params: GetProductivityScoreInput, ctx
 
 @mcp.tool(
     name="ticktick_list_habits",
-    annotations={"title": "List Habits", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "List Habits"},
 )
 async def ticktick_list_habits(params: ListHabitsInput, ctx: Context) -> str:
     """List all habits with current streak and settings.
@@ -1184,7 +1354,7 @@ async def ticktick_list_habits(params: ListHabitsInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_checkin_habit",
-    annotations={"title": "Check In Habit", "readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_IDEMPOTENT_WRITE, "title": "Check In Habit"},
 )
 async def ticktick_checkin_habit(params: CheckinHabitInput, ctx: Context) -> str:
     """Mark a habit as done for today (or a specific date).
@@ -1195,10 +1365,10 @@ async def ticktick_checkin_habit(params: CheckinHabitInput, ctx: Context) -> str
     """
     try:
         v2 = _get_v2_client(ctx)
-        stamp = params.date or datetime.now(timezone.utc).strftime("%Y%m%d")
+        stamp = params.date or int(datetime.now(timezone.utc).strftime("%Y%m%d"))
         checkin = {
             "habitId": params.habit_id,
-            "checkinStamp": int(stamp),
+            "checkinStamp": stamp,
             "status": 2,  # 2 = completed
         }
         if params.value is not None:
@@ -1212,7 +1382,7 @@ async def ticktick_checkin_habit(params: CheckinHabitInput, ctx: Context) -> str
 
 @mcp.tool(
     name="ticktick_get_habit_stats",
-    annotations={"title": "Habit Statistics", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "Habit Statistics"},
 )
 async def ticktick_get_habit_stats(params: GetHabitStatsInput, ctx: Context) -> str:
     """Get habit performance data: completion rate, streak, history.
@@ -1228,6 +1398,7 @@ async def ticktick_get_habit_stats(params: GetHabitStatsInput, ctx: Context) ->
 
         checkins = await v2.get_habit_checkins([params.habit_id], after_stamp)
         completed = [c for c in checkins if c.get("status") == 2 and c.get("habitId") == params.habit_id]
+        streak = current_streak(c.get("checkinStamp") for c in completed)
 
         if params.response_format == ResponseFormat.JSON:
             return format_json({
@@ -1235,6 +1406,7 @@ async def ticktick_get_habit_stats(params: GetHabitStatsInput, ctx: Context) ->
                 "days_analyzed": params.days,
                 "completed_count": len(completed),
                 "completion_rate": len(completed) / params.days if params.days > 0 else 0,
+                "current_streak": streak,
                 "checkins": completed,
             })
 
@@ -1243,11 +1415,10 @@ async def ticktick_get_habit_stats(params: GetHabitStatsInput, ctx: Context) ->
         lines.append(f"**Period:** Last {params.days} days")
         lines.append(f"**Completed:** {len(completed)} / {params.days} days ({rate:.0f}%)")
 
-        # Simple streak calculation from recent checkins
-        sorted_checkins = sorted(completed, key=lambda c: c.get("checkinStamp", 0), reverse=True)
-        if sorted_checkins:
-            latest = str(sorted_checkins[0].get("checkinStamp", ""))
+        if completed:
+            latest = max(c.get("checkinStamp", 0) for c in completed)
             lines.append(f"**Last Check-in:** {latest}")
+            lines.append(f"**Streak:** {streak} days (up to last check-in)")
 
         return truncate_response("\n".join(lines))
     except Exception as e:
@@ -1261,7 +1432,7 @@ async def ticktick_get_habit_stats(params: GetHabitStatsInput, ctx: Context) ->
 
 @mcp.tool(
     name="ticktick_list_tags",
-    annotations={"title": "List Tags", "readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_READ_ONLY, "title": "List Tags"},
 )
 async def ticktick_list_tags(params: ListTagsInput, ctx: Context) -> str:
     """List all tags. V2 API exposes full tag management that V1 doesn't.
@@ -1286,7 +1457,7 @@ async def ticktick_list_tags(params: ListTagsInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_create_tag",
-    annotations={"title": "Create Tag", "readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True},
+    annotations={**_WRITE, "title": "Create Tag"},
 )
 async def ticktick_create_tag(params: CreateTagInput, ctx: Context) -> str:
     """Create a new tag. Supports nesting via parent parameter.
@@ -1308,7 +1479,7 @@ async def ticktick_create_tag(params: CreateTagInput, ctx: Context) -> str:
 
 @mcp.tool(
     name="ticktick_rename_tag",
-    annotations={"title": "Rename Tag", "readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True},
+    annotations={**_IDEMPOTENT_WRITE, "title": "Rename Tag"},
 )
 async def ticktick_rename_tag(params: RenameTagInput, ctx: Context) -> str:
     """Rename an existing tag. All tasks with the old tag are updated automatically.
@@ -1327,33 +1498,49 @@ async def ticktick_rename_tag(params: RenameTagInput, ctx: Context) -> str:
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+def _subtask_to_item(subtask) -> dict:
+    """Convert one SubtaskInput to a TickTick checklist item."""
+    item = {"title": subtask.title, "status": subtask.status}
+    if subtask.sort_order is not None:
+        item["sortOrder"] = subtask.sort_order
+    return item
+
+
+def _subtasks_to_items(subtasks: list) -> list[dict]:
+    """Convert SubtaskInput models to TickTick checklist items."""
+    return [_subtask_to_item(s) for s in subtasks]
+
+
+# Optional task fields shared by create and update: (param attr, API key, transform).
+_TASK_FIELDS = (
+    ("title", "title", None),
+    ("content", "content", None),
+    ("priority", "priority", None),
+    ("due_date", "dueDate", None),
+    ("start_date", "startDate", None),
+    ("is_all_day", "isAllDay", None),
+    ("time_zone", "timeZone", None),
+    ("tags", "tags", None),
+    ("subtasks", "items", _subtasks_to_items),
+    ("repeat_flag", "repeatFlag", None),
+    ("reminders", "reminders", None),
+)
+
+
+def _apply_task_fields(body: dict, params, *, skip_empty: bool) -> dict:
+    """Copy the optional task fields set on `params` into `body`.
+
+    None is always skipped. With skip_empty, empty values ("", [], 0) are
+    skipped too; False booleans are still sent.
+    """
+    for attr, key, transform in _TASK_FIELDS:
+        value = getattr(params, attr)
+        if value is None or (skip_empty and not value and value is not False):
+            continue
+        body[key] = transform(value) if transform else value
+    return body
+
+
 def _build_task_body(params: CreateTaskInput) -> dict:
     """Build a TickTick API task body from CreateTaskInput."""
-    body: dict = {
-        "title": params.title,
-        "projectId": params.project_id,
-    }
-    if params.content:
-        body["content"] = params.content
-    if params.priority and params.priority.value != 0:
-        body["priority"] = params.priority.value
-    if params.due_date:
-        body["dueDate"] = params.due_date
-    if params.start_date:
-        body["startDate"] = params.start_date
-    if params.is_all_day is not None:
-        body["isAllDay"] = params.is_all_day
-    if params.time_zone:
-        body["timeZone"] = params.time_zone
-    if params.tags:
-        body["tags"] = params.tags
-    if params.subtasks:
-        body["items"] = [
-            {"title": s.title, "status": s.status, **({"sortOrder": s.sort_order} if s.sort_order is not None else {})}
-            for s in params.subtasks
-        ]
-    if params.repeat_flag:
-        body["repeatFlag"] = params.repeat_flag
-    if params.reminders:
-        body["reminders"] = params.reminders
-    return body
+    return _apply_task_fields({"projectId": params.project_id}, params, skip_empty=True)
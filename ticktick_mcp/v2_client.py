@@ -6,17 +6,50 @@ by the V1 OAuth API: focus stats, habits, tags, productivity scores.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
 import os
-import uuid
+import secrets
+import time
+from importlib.util import find_spec
 
 import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 load_dotenv()
 
 V2_BASE_URL = "https://ticktick.com/api/v2"
-SIGNON_URL = f"{V2_BASE_URL}/user/signon"
+_SIGNON_PARAMS = {"wc": "true", "remember": "true"}
 REQUEST_TIMEOUT = 30.0
+# Seconds to reuse stats reads between tool calls; 0 disables the cache.
+CACHE_TTL = float(os.getenv("TICKTICK_CACHE_TTL", "30"))
+
+# All V2 calls go to one host, so HTTP/2 (optional `h2` package) lets the
+# focus/habit/stats fetches a tool fires together share one connection.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
+
+# Path prefixes for the per-period focus endpoints ({from}/{to} appended)
+_HEATMAP_PREFIX = "/pomodoros/statistics/heatmap/"
+_DIST_PREFIX = "/pomodoros/statistics/dist/"
+
+ERROR_DETAIL_BYTES = 512  # error bodies kept in exception messages
+
+# Max V2 requests in flight per client; bursts beyond it queue instead of
+# tripping the rate limit and the re-auth that tends to follow.
+V2_CONCURRENCY = int(os.getenv("TICKTICK_V2_CONCURRENCY", "10"))
+
+# Send the session token only as the "t" cookie, without the duplicate
+# Bearer header. Opt-in until cookie-only auth is confirmed on every endpoint.
+V2_COOKIE_ONLY = os.getenv("TICKTICK_V2_COOKIE_ONLY", "").lower() in ("1", "true", "yes")
 
 
 class V2AuthError(Exception):
@@ -32,17 +65,45 @@ class TickTickV2APIError(Exception):
         super().__init__(f"TickTick V2 API error {status_code}: {detail}")
 
 
+class _V2Auth(httpx.Auth):
+    """Signs each request with the client's current session token.
+
+    The token is read at send time, so a re-auth applies to every request
+    sent after it without touching the shared client headers.
+    """
+
+    def __init__(self, client: TickTickV2Client) -> None:
+        self._client = client
+
+    def auth_flow(self, request: httpx.Request):
+        token = self._client._token
+        if token is not None and not self._client._cookie_only:
+            request.headers["Authorization"] = f"Bearer {token}"
+        yield request
+
+
 class TickTickV2Client:
     """Async client for TickTick's undocumented V2 API.
 
     Requires username/password auth (separate from V1 OAuth token).
     Session tokens are managed automatically with re-auth on expiry.
+
+    Focus and statistics reads are cached for CACHE_TTL seconds
+    (TICKTICK_CACHE_TTL); any V2 write clears the cache.
     """
 
+    __slots__ = (
+        "_username", "_password", "_token", "_auth_lock", "_sem",
+        "_cache_ttl", "_cache", "_cache_generation", "_cookie_only",
+        "_device_id", "_x_device", "_signon_body", "_signon_headers", "_http",
+    )
+
     def __init__(
         self,
         username: str | None = None,
         password: str | None = None,
+        cache_ttl: float | None = None,
+        cookie_only: bool | None = None,
     ) -> None:
         self._username = username or os.getenv("TICKTICK_USERNAME", "")
         self._password = password or os.getenv("TICKTICK_PASSWORD", "")
@@ -59,10 +120,44 @@ class TickTickV2Client:
             )
 
         self._token: str | None = None
-        self._device_id = uuid.uuid4().hex[:24]
+        # Serializes signons so concurrent requests that all find the token
+        # missing or expired trigger one signon instead of one each
+        self._auth_lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(V2_CONCURRENCY)
+        self._cache_ttl = CACHE_TTL if cache_ttl is None else cache_ttl
+        self._cache: dict[str, tuple[float, dict | list | None]] = {}
+        self._cache_generation = 0
+        self._cookie_only = V2_COOKIE_ONLY if cookie_only is None else cookie_only
+        self._device_id = secrets.token_hex(12)
+        # Fixed per client, so serialized once rather than on every signon
+        self._x_device = json.dumps(
+            {
+                "platform": "web",
+                "os": "macOS 10.15",
+                "device": "Chrome 120",
+                "name": "",
+                "version": 6430,
+                "id": self._device_id,
+                "channel": "website",
+                "campaign": "",
+            },
+            separators=(",", ":"),
+        )
+        # Signon request parts are fixed too; re-auths on 401 reuse them
+        self._signon_body = json.dumps(
+            {"username": self._username, "password": self._password}
+        ).encode()
+        self._signon_headers = {
+            "Content-Type": "application/json",
+            "X-Device": self._x_device,
+        }
         self._http = httpx.AsyncClient(
             base_url=V2_BASE_URL,
+            headers={"User-Agent": "Mozilla/5.0"},
+            auth=_V2Auth(self),
             timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            limits=CONNECTION_LIMITS,
         )
 
     @property
@@ -71,28 +166,22 @@ class TickTickV2Client:
 
     async def authenticate(self) -> None:
         """Sign in to V2 API and store session token."""
-        device_info = {
-            "platform": "web",
-            "os": "macOS 10.15",
-            "device": "Chrome 120",
-            "name": "",
-            "version": 6430,
-            "id": self._device_id,
-            "channel": "website",
-            "campaign": "",
-        }
+        async with self._auth_lock:
+            await self._signon()
 
+    async def _reauthenticate(self, stale_token: str | None) -> None:
+        """Sign in again unless another request already replaced `stale_token`."""
+        async with self._auth_lock:
+            if self._token is not None and self._token != stale_token:
+                return
+            await self._signon()
+
+    async def _signon(self) -> None:
         response = await self._http.post(
-            f"{V2_BASE_URL}/user/signon",
-            params={"wc": "true", "remember": "true"},
-            json={
-                "username": self._username,
-                "password": self._password,
-            },
-            headers={
-                "User-Agent": "Mozilla/5.0",
-                "X-Device": str(device_info).replace("'", '"'),
-            },
+            "/user/signon",
+            params=_SIGNON_PARAMS,
+            content=self._signon_body,
+            headers=self._signon_headers,
         )
 
         if response.status_code != 200:
@@ -106,8 +195,8 @@ class TickTickV2Client:
         if not self._token:
             raise V2AuthError("No token returned from signon response")
 
-        # Update client headers with auth token
-        self._http.headers["Authorization"] = f"Bearer {self._token}"
+        # The web API reads the cookie; _V2Auth adds the Bearer header unless
+        # cookie-only auth is enabled
         self._http.cookies.set("t", self._token)
 
     async def _request(
@@ -120,49 +209,121 @@ class TickTickV2Client:
     ) -> dict | list | None:
         """Make an authenticated V2 API request. Re-auths on 401."""
         if not self.is_authenticated:
-            await self.authenticate()
-
-        response = await self._http.request(
-            method, path, json=json_body, params=params,
-        )
+            await self._reauthenticate(None)
 
-        # Re-authenticate on 401 and retry once
-        if response.status_code == 401:
-            await self.authenticate()
+        token = self._token
+        async with self._sem:
             response = await self._http.request(
                 method, path, json=json_body, params=params,
             )
 
+        # Re-authenticate on 401 and retry once
+        if response.status_code == 401:
+            await self._reauthenticate(token)
+            async with self._sem:
+                response = await self._http.request(
+                    method, path, json=json_body, params=params,
+                )
+
+        if method != "GET":
+            self.invalidate_cache()
         if response.status_code >= 400:
-            detail = response.text or f"HTTP {response.status_code}"
+            # Only the head of the body is decoded; error pages can be large
+            content = response.content
+            detail = (
+                content[:ERROR_DETAIL_BYTES].decode("utf-8", "replace")
+                if content else f"HTTP {response.status_code}"
+            )
             raise TickTickV2APIError(response.status_code, detail)
 
-        if response.status_code == 204 or not response.text:
+        if response.status_code == 204 or not response.content:
             return None
 
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
+    async def _cached_get(self, path: str) -> dict | list | None:
+        """GET through the short-lived read cache.
+
+        Callers get their own copy, so nothing they change leaks into
+        later reads.
+        """
+        if self._cache_ttl <= 0:
+            return await self._request("GET", path)
+        now = time.monotonic()
+        hit = self._cache.get(path)
+        if hit is not None and hit[0] > now:
+            return copy.deepcopy(hit[1])
+        generation = self._cache_generation
+        result = await self._request("GET", path)
+        # A write while this GET was in flight means the result may predate it
+        if generation == self._cache_generation:
+            self._cache[path] = (now + self._cache_ttl, result)
+        return copy.deepcopy(result)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached reads (called automatically after every write)."""
+        self._cache.clear()
+        self._cache_generation += 1
+
     async def close(self) -> None:
         """Close the underlying HTTP client."""
         await self._http.aclose()
 
+    async def __aenter__(self) -> TickTickV2Client:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    async def get_all_tasks(self) -> tuple[list[dict], list[dict]]:
+        """GET /batch/check/0 -- full sync of projects and active tasks in one call.
+
+        Returns (projects, tasks).
+        """
+        result = await self._request("GET", "/batch/check/0")
+        if not isinstance(result, dict):
+            return [], []
+        projects = result.get("projectProfiles") or []
+        tasks = (result.get("syncTaskBean") or {}).get("update") or []
+        return projects, tasks
+
     # ------------------------------------------------------------------
     # Focus / Pomodoro (read-only)
     # ------------------------------------------------------------------
 
     async def get_focus_heatmap(self, date_from: str, date_to: str) -> list[dict]:
         """GET /pomodoros/statistics/heatmap/{from}/{to}"""
-        result = await self._request("GET", f"/pomodoros/statistics/heatmap/{date_from}/{date_to}")
+        result = await self._cached_get(_HEATMAP_PREFIX + date_from + "/" + date_to)
         return result if isinstance(result, list) else []
 
     async def get_focus_distribution(self, date_from: str, date_to: str) -> list[dict]:
         """GET /pomodoros/statistics/dist/{from}/{to}"""
-        result = await self._request("GET", f"/pomodoros/statistics/dist/{date_from}/{date_to}")
+        result = await self._cached_get(_DIST_PREFIX + date_from + "/" + date_to)
         return result if isinstance(result, list) else []
 
+    async def fetch_focus(self, date_from: str, date_to: str) -> tuple[list[dict], list[dict]]:
+        """Heatmap and distribution for one period, fetched concurrently.
+
+        Returns (heatmap, distribution).
+        """
+        if not self.is_authenticated:
+            # Sign on before fanning out so both requests reuse the session
+            await self._reauthenticate(None)
+        heatmap, distribution = await asyncio.gather(
+            self.get_focus_heatmap(date_from, date_to),
+            self.get_focus_distribution(date_from, date_to),
+        )
+        return heatmap, distribution
+
     async def get_general_statistics(self) -> dict:
         """GET /statistics/general -- productivity scores, pomo totals, task counts."""
-        result = await self._request("GET", "/statistics/general")
+        result = await self._cached_get("/statistics/general")
         return result if isinstance(result, dict) else {}
 
     # ------------------------------------------------------------------
@@ -201,13 +362,7 @@ class TickTickV2Client:
         delete: list[str] | None = None,
     ) -> dict:
         """POST /batch/tag -- create, update, or delete tags."""
-        body: dict = {}
-        if add:
-            body["add"] = add
-        if update:
-            body["update"] = update
-        if delete:
-            body["delete"] = delete
+        body = {k: v for k, v in (("add", add), ("update", update), ("delete", delete)) if v}
         result = await self._request("POST", "/batch/tag", json_body=body)
         return result if isinstance(result, dict) else {}
 